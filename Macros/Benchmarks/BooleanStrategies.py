@@ -0,0 +1,100 @@
+"""
+Time every Booleans strategy on the sample parts and record which one
+Booleans.choose() would pick.
+
+Runs headless:  freecadcmd Benchmarks/BooleanStrategies.py
+For each part the largest planar face is offset inwards, filled with a
+honeycomb lattice, and the non-outside prisms are cut from the plate with
+each strategy. Results are printed and written to boolean_benchmark.csv.
+"""
+import csv
+import os
+import sys
+import time
+
+import FreeCAD as App
+import Part
+
+MACROS = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(MACROS)
+
+import Libraries001.Booleans as Booleans
+import Libraries001.Clipping as Clipping
+import Libraries001.Geometry as Geometry
+import Libraries001.Lattices as Lattices
+import Libraries001.Prisms as Prisms
+
+REPO = os.path.dirname(MACROS)
+SAMPLES = [
+    "BYU-Idaho/ME172/CAD4-Part.step",
+    "BYU-Idaho/ME172/CAD4-PartHole.step",
+    "BYU-Idaho/ME280/3MF/RingGearLid001.step",
+    "BYU-Idaho/ME280/3MF/SolarConnector001.step",
+]
+hexRadius = 2
+hexSeparation = 0.2
+hexExtrusion = -2
+planeOffset = -3
+# Sequential per-cell cuts are skipped above this many tools
+PER_CELL_LIMIT = 300
+
+
+def largestPlanarFace(shape):
+    planar = [f for f in shape.Faces if f.Surface.TypeId == "Part::GeomPlane"]
+    return max(planar, key=lambda f: f.Area)
+
+
+def sample(path):
+    face = largestPlanarFace(Part.read(path))
+    face = face.makeOffset2D(planeOffset)
+    loops = Geometry.faceLoops(face)
+    frame = Lattices.planeFrame(Geometry.faceNormal(face), loops[0].mean(axis=0))
+    rings = [Lattices.toPlane(loop, frame) for loop in loops]
+    bounds = (*rings[0].min(axis=0), *rings[0].max(axis=0))
+    centers, cells = Lattices.hexLattice(hexRadius, hexSeparation, bounds)
+    labels = Clipping.classifyCells(centers, cells, rings)
+
+    direction = App.Vector(*frame[3]) * hexExtrusion
+    base = face.extrude(direction)
+    tools = Prisms.prisms(
+        Lattices.fromPlane(cells[labels != Clipping.OUTSIDE], frame, w=-0.1 * hexExtrusion),
+        direction * 1.2,
+    )
+    return base, tools, sum(len(r) for r in rings)
+
+
+def main(output="boolean_benchmark.csv"):
+    rows = []
+    for name in SAMPLES:
+        base, tools, edges = sample(os.path.join(REPO, name))
+        chosen = Booleans.choose(len(tools))
+        for strategy in Booleans.STRATEGIES:
+            if strategy == "cells" and len(tools) > PER_CELL_LIMIT:
+                seconds = None
+            else:
+                start = time.perf_counter()
+                Booleans.cut(base, tools, strategy=strategy)
+                seconds = time.perf_counter() - start
+            rows.append({
+                "part": name,
+                "cells": len(tools),
+                "edges": edges,
+                "strategy": strategy,
+                "chosen": strategy == chosen,
+                "seconds": "" if seconds is None else f"{seconds:.3f}",
+            })
+            App.Console.PrintMessage(
+                f"{name}: {len(tools)} cells, {strategy:>8} "
+                f"{'skipped' if seconds is None else f'{seconds:.3f} s'}"
+                f"{'  <- auto' if strategy == chosen else ''}\n"
+            )
+
+    with open(output, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
+    return rows
+
+
+if __name__ == "__main__":
+    main()
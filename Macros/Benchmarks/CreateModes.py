@@ -0,0 +1,101 @@
+"""
+Compare HexagonalPattern.create() modes on the selected face.
+
+Select a face in the GUI and run this macro. For each mode it reports the
+build time, the time of a full forced recompute of the generated objects,
+the number of document objects added and the resident memory they cost.
+"""
+import os
+import sys
+import time
+
+import FreeCAD as App
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import Libraries001.Patterns as Patterns
+import Libraries001.Planes as Planes
+import Libraries001.Spreadsheets as SpreadSheet
+
+
+def residentMemory():
+    """Resident set size in MB (Linux /proc, 0 elsewhere)."""
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024.0
+    except OSError:
+        pass
+    return 0.0
+
+
+def measure(mode, userSpreadsheet, autoGeneratedSpreadsheet, offset2D, binder):
+    doc = App.ActiveDocument
+    before = set(o.Name for o in doc.Objects)
+    memory = residentMemory()
+
+    start = time.perf_counter()
+    hexagons = Patterns.HexagonalPattern(
+        userSheet=userSpreadsheet,
+        autoGeneratedSheet=autoGeneratedSpreadsheet,
+        offset2D=offset2D,
+        type="hexagons",
+    )
+    hexagons.create(mode=mode)
+    hexagons.align(binder)
+    hexagons.extrude()
+    doc.recompute()
+    build = time.perf_counter() - start
+
+    added = [doc.getObject(n) for n in set(o.Name for o in doc.Objects) - before]
+    for obj in added:
+        obj.touch()
+    start = time.perf_counter()
+    doc.recompute()
+    recompute = time.perf_counter() - start
+
+    return {
+        "mode": mode,
+        "cells": len(hexagons.centers),
+        "build": build,
+        "recompute": recompute,
+        "objects": len(added),
+        "memory": residentMemory() - memory,
+        "added": added,
+    }
+
+
+def main():
+    sheet = SpreadSheet.SpreadSheet()
+    userSpreadsheet = sheet.userSpreadSheet()
+    plane = Planes.Plane()
+    binder = plane.createShapeBinder()
+    offset2D = plane.createOffset2D(binder)
+    autoGeneratedSpreadsheet = sheet.compute(offset2D=offset2D)
+
+    results = []
+    for mode in ("draft", "direct"):
+        result = measure(mode, userSpreadsheet, autoGeneratedSpreadsheet, offset2D, binder)
+        for obj in result.pop("added"):
+            if obj.Name in [o.Name for o in App.ActiveDocument.Objects]:
+                App.ActiveDocument.removeObject(obj.Name)
+        App.ActiveDocument.recompute()
+        results.append(result)
+
+    for r in results:
+        App.Console.PrintMessage(
+            f"{r['mode']:>6}: {r['cells']} cells, build {r['build']:.3f} s, "
+            f"recompute {r['recompute']:.3f} s, {r['objects']} objects, {r['memory']:+.1f} MB\n"
+        )
+    draft, direct = results
+    App.Console.PrintMessage(
+        f"direct vs draft: recompute x{draft['recompute'] / max(direct['recompute'], 1e-9):.1f} faster, "
+        f"{draft['memory'] - direct['memory']:.1f} MB less memory, "
+        f"{draft['objects'] - direct['objects']} fewer objects\n"
+    )
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""
+Expanded Draft arrays against App::Link instancing at growing cell counts.
+
+Runs in the GUI (scene graph measured) or headless:
+    freecadcmd Benchmarks/Instancing.py
+For every count in COUNTS a fresh document gets a square face sized to hold
+about that many hexagons, built once with HexagonalPattern.create("draft")
+(ExpandArray: one child object per cell) and once with create("link")
+(one prototype, ElementCount / PlacementList). Reported per build: document
+objects, saved FCStd size, Coin scene-graph nodes (GUI only), resident
+memory added and build time.
+"""
+import os
+import sys
+import tempfile
+import time
+
+import FreeCAD as App
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import Libraries001.Lattices as Lattices
+import Libraries001.Patterns as Patterns
+import Libraries001.Recomputes as Recomputes
+import Libraries001.Spreadsheets as SpreadSheet
+from Benchmarks.CreateModes import residentMemory
+
+COUNTS = (1000, 5000, 20000)
+MODES = ("draft", "link")
+RADIUS = 1.0
+SEPARATION = 0.2
+
+
+def sceneNodes():
+    """Coin nodes in the active 3D view's scene graph, or None without the GUI."""
+    if not App.GuiUp:
+        return None
+    import FreeCADGui as Gui
+    from pivy import coin
+
+    Gui.updateGui()
+    search = coin.SoSearchAction()
+    search.setType(coin.SoNode.getClassTypeId())
+    search.setInterest(coin.SoSearchAction.ALL)
+    search.setSearchingAll(True)
+    search.apply(Gui.ActiveDocument.ActiveView.getSceneGraph())
+    return search.getPaths().getLength()
+
+
+def builtCells(hexagons):
+    """Cells actually built: array elements (NumberX * NumberY per row) or link elements."""
+    if hexagons.mode == "draft":
+        return sum(row.NumberX * row.NumberY for row in (hexagons.row1, hexagons.row2))
+    links = getattr(hexagons.fusedArrays, "Links", None) or [hexagons.fusedArrays]
+    return sum(link.ElementCount for link in links)
+
+
+def side(count):
+    """Side of the square holding about `count` hexagons (two per xInterval x yInterval)."""
+    xInterval, yInterval = Lattices.hexPitch(RADIUS, SEPARATION)
+    return (count * xInterval * yInterval / 2) ** 0.5
+
+
+def measure(count, mode, folder):
+    doc = App.newDocument(f"Instancing_{mode}_{count}")
+    App.setActiveDocument(doc.Name)
+    try:
+        sheet = SpreadSheet.SpreadSheet()
+        sheet.hexRadius, sheet.hexSeparation = RADIUS, SEPARATION
+        userSpreadsheet = sheet.userSpreadSheet()
+        face = doc.addObject("Part::Plane", "Face")
+        face.Length = face.Width = side(count)
+        Recomputes.recompute(doc)
+        autoGeneratedSpreadsheet = sheet.compute(offset2D=face)
+
+        objects, nodes, memory = len(doc.Objects), sceneNodes(), residentMemory()
+        start = time.perf_counter()
+        hexagons = Patterns.HexagonalPattern(userSpreadsheet, autoGeneratedSpreadsheet, face, "hexagons")
+        hexagons.create(mode=mode)
+        Recomputes.recompute(doc)
+        build = time.perf_counter() - start
+
+        path = os.path.join(folder, f"{doc.Name}.FCStd")
+        doc.saveAs(path)
+        after = sceneNodes()
+        return {
+            "cells": builtCells(hexagons),
+            "mode": mode,
+            "objects": len(doc.Objects) - objects,
+            "fileSize": os.path.getsize(path) / 1024.0,
+            "nodes": None if after is None else after - nodes,
+            "memory": residentMemory() - memory,
+            "build": build,
+        }
+    finally:
+        App.closeDocument(doc.Name)
+
+
+def main(counts=COUNTS):
+    folder = tempfile.mkdtemp(prefix="honeycomb-instancing-")
+    results = [measure(count, mode, folder) for count in counts for mode in MODES]
+    for r in results:
+        nodes = "-" if r["nodes"] is None else r["nodes"]
+        App.Console.PrintMessage(
+            f"{r['cells']:>6} cells {r['mode']:>5}: {r['objects']:>6} objects, "
+            f"{r['fileSize']:>9.1f} KB, {nodes:>7} nodes, {r['memory']:+8.1f} MB, {r['build']:.2f} s\n"
+        )
+    for draft, link in zip(results[::2], results[1::2]):
+        App.Console.PrintMessage(
+            f"{draft['cells']:>6} cells: link uses {draft['objects'] - link['objects']} fewer objects, "
+            f"a {draft['fileSize'] / max(link['fileSize'], 1e-9):.1f}x smaller file, "
+            f"{draft['memory'] - link['memory']:.1f} MB less memory\n"
+        )
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""
+Sweep the honeycomb parameters over a grid and tabulate the results.
+
+Runs headless:  freecadcmd Benchmarks/ParameterSweep.py
+Every combination of GRID is built on FACE of OBJECT in TARGET, spread
+over a process pool with one private copy of the document per worker.
+Cell count, removed volume, mass and build time are printed and written
+to parameter_sweep.csv.
+"""
+import os
+import sys
+import time
+
+import FreeCAD as App
+
+MACROS = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(MACROS)
+
+import Libraries001.Sweeps as Sweeps
+
+TARGET = os.path.join(MACROS, "Tests", "Honeycomb001.FCStd")
+OBJECT = "Pad"
+FACE = "Face6"
+GRID = {
+    "hexRadius": [1.5, 2, 2.5, 3, 4],
+    "hexSeparation": [0.2, 0.4, 0.6, 0.8],
+    "hexExtrusion": [-2],
+    "planeOffset": [-2, -3, -4, -5, -6],
+}
+
+
+def main(output="parameter_sweep.csv", workers=None):
+    combinations = Sweeps.grid(**GRID)
+    start = time.perf_counter()
+    rows = Sweeps.sweep(TARGET, OBJECT, FACE, combinations, workers=workers, output=output)
+    for row in rows:
+        parameters = ", ".join(f"{name}={row[name]}" for name in GRID)
+        if "error" in row:
+            App.Console.PrintMessage(f"{parameters}: {row['error']}\n")
+            continue
+        App.Console.PrintMessage(
+            f"{parameters}: {row['cells']} cells, {row['removedVolume']:.1f} mm^3 removed, "
+            f"{row['mass']:.2f} g, {row['seconds']:.2f} s\n"
+        )
+    App.Console.PrintMessage(
+        f"{len(rows)} combinations in {time.perf_counter() - start:.1f} s -> {output}\n"
+    )
+    return rows
+
+
+if __name__ == "__main__":
+    main()
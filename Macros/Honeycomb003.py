@@ -1,17 +1,15 @@
-import Libraries001.Folders as Folders
 import Libraries001.Planes as Planes
 import Libraries001.Patterns as Patterns
+import Libraries001.Recomputes as Recomputes
 import Libraries001.Spreadsheets as SpreadSheet
 
 from PySide import QtCore
-import FreeCADGui as Gui
 import FreeCAD as App
-import importlib
+import Libraries001
 
-importlib.reload(Folders)
-importlib.reload(Planes)
-importlib.reload(Patterns)
-importlib.reload(SpreadSheet)
+# Re-run only what was edited since the last run, and report slow imports
+Libraries001.reloadChanged()
+Libraries001.importReport()
 
 
 hexSeparation       = .2
@@ -32,54 +30,56 @@ def delete_after_delay(objs, delay_ms=10000):
                     doc.removeObject(obj.Name)
             except Exception:
                 pass
-        doc.recompute()
+        Recomputes.recompute(doc)
     QtCore.QTimer.singleShot(delay_ms, _delete)
 
 
 def main():
-    # 1) Build user spreadsheet and binder
-    sheet = SpreadSheet.SpreadSheet()
-    userSpreadsheet = sheet.userSpreadSheet()
+    Recomputes.reset()
 
-    plane = Planes.Plane()
-    binder = plane.createShapeBinder()
+    # One undo step and one redraw for the whole build; recomputes run once at the end
+    with Recomputes.batch(App.ActiveDocument, "Honeycomb"):
+        # 1) Build user spreadsheet and binder
+        sheet = SpreadSheet.SpreadSheet()
+        userSpreadsheet = sheet.userSpreadSheet()
 
-    # 2) Offsets and extrusions
-    offset2D_a = plane.createOffset2D(binder)
-    offset2D_b = plane.createOffset2D(binder)
+        plane = Planes.Plane()
+        binder = plane.createShapeBinder()
 
-    plane.align(binder, offset2D_a)
-    plane.align(binder, offset2D_b)
+        # 2) Offsets and extrusions
+        offset2D_a = plane.createOffset2D(binder)
+        offset2D_b = plane.createOffset2D(binder)
 
-    extrusion_a = plane.extrude(offset2D_a, spreadsheet=userSpreadsheet)
-    extrusion_b = plane.extrude(offset2D_b, spreadsheet=userSpreadsheet)
+        plane.align(binder, offset2D_a)
+        plane.align(binder, offset2D_b)
 
-    # 3) Auto sheet + hex pattern
-    autoGeneratedSpreadsheet = sheet.compute(offset2D=offset2D_a)
+        extrusion_a = plane.extrude(offset2D_a, spreadsheet=userSpreadsheet)
+        extrusion_b = plane.extrude(offset2D_b, spreadsheet=userSpreadsheet)
 
-    hexagons = Patterns.HexagonalPattern(
-        userSheet=userSpreadsheet,
-        autoGeneratedSheet=autoGeneratedSpreadsheet,
-        offset2D=offset2D_a,
-        type='hexagons'
-    )
+        # 3) Auto sheet + hex pattern
+        autoGeneratedSpreadsheet = sheet.compute(offset2D=offset2D_a)
 
-    hexagons.create()
-    hexagons.align(binder)
-    fused = hexagons.extrude()
+        hexagons = Patterns.HexagonalPattern(
+            userSheet=userSpreadsheet,
+            autoGeneratedSheet=autoGeneratedSpreadsheet,
+            offset2D=offset2D_a,
+            type='hexagons'
+        )
 
-    cutA = plane.doc.addObject('Part::Cut', 'Cut_OffsetA_minus_Hexagons')
-    cutA.Base = extrusion_a
-    cutA.Tool = fused
+        hexagons.create()
+        hexagons.align(binder)
+        fused = hexagons.extrude()
 
-    cutB = plane.doc.addObject('Part::Cut', 'Cut_OffsetB_minus_Body')
-    cutB.Base = plane.body
-    cutB.Tool = extrusion_b
+        cutA = plane.doc.addObject('Part::Cut', 'Cut_OffsetA_minus_Hexagons')
+        cutA.Base = extrusion_a
+        cutA.Tool = fused
 
-    
+        cutB = plane.doc.addObject('Part::Cut', 'Cut_OffsetB_minus_Body')
+        cutB.Base = plane.body
+        cutB.Tool = extrusion_b
 
-    plane.doc.recompute()
-    Gui.SendMsgToActiveView("ViewFit")
+        Recomputes.viewFit()
+    Recomputes.report()
 
 
 if __name__ == "__main__":
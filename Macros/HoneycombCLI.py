@@ -0,0 +1,84 @@
+"""
+Build the honeycomb without the GUI.
+
+    freecadcmd HoneycombCLI.py --pass Part.FCStd Pad Face6 --radius 2 --output Out.FCStd
+    python3 HoneycombCLI.py Part.FCStd Pad Face6 --radius 2     (FREECAD_LIB on the path)
+
+Opens the document, runs the same pipeline as Honeycomb004 (lattice,
+classify, cut) on the given face, prints the cell count, removed volume,
+build time and recompute report, and saves the result when --output is set.
+"""
+import argparse
+import os
+import sys
+
+MACROS = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(MACROS)
+if os.environ.get("FREECAD_LIB"):
+    sys.path.append(os.environ["FREECAD_LIB"])
+
+import FreeCAD as App
+
+import Libraries001.Booleans as Booleans
+import Libraries001.Pipelines as Pipelines
+import Libraries001.Recomputes as Recomputes
+import Libraries001.Spreadsheets as SpreadSheet
+import Libraries001.Sweeps as Sweeps
+
+
+def parse(argv):
+    parser = argparse.ArgumentParser(description="Cut a honeycomb into one face of a FreeCAD document.")
+    parser.add_argument("document", help="FCStd file to open")
+    parser.add_argument("object", help="name of the object owning the face, e.g. Pad")
+    parser.add_argument("face", help="face subname, e.g. Face6")
+    parser.add_argument("--radius", type=float, default=SpreadSheet.hexRadius)
+    parser.add_argument("--separation", type=float, default=SpreadSheet.hexSeparation)
+    parser.add_argument("--height", type=float, default=SpreadSheet.hexExtrusion)
+    parser.add_argument("--offset", type=float, default=SpreadSheet.planeOffset)
+    parser.add_argument("--strategy", default="auto", choices=["auto", *Booleans.STRATEGIES])
+    parser.add_argument("--mode", default="direct", choices=Pipelines.MODES, help="uv for curved faces")
+    parser.add_argument("--output", help="save the document here (default: do not save)")
+    return parser.parse_args(argv)
+
+
+def arguments():
+    """Script arguments: everything after --pass under freecadcmd, else argv[1:]."""
+    argv = sys.argv
+    if "--pass" in argv:
+        return argv[argv.index("--pass") + 1:]
+    return argv[1:]
+
+
+def main(argv=None):
+    args = parse(arguments() if argv is None else argv)
+    doc = App.openDocument(os.path.abspath(args.document), hidden=not App.GuiUp)
+    App.setActiveDocument(doc.Name)
+
+    Recomputes.reset()
+    result = Sweeps.build(
+        doc,
+        args.object,
+        args.face,
+        {
+            "hexRadius": args.radius,
+            "hexSeparation": args.separation,
+            "hexExtrusion": args.height,
+            "planeOffset": args.offset,
+        },
+        strategy=args.strategy,
+        mode=args.mode,
+    )
+    App.Console.PrintMessage(
+        f"{result['cells']} cells ({result['strategy']}), "
+        f"{result['removedVolume']:.1f} mm^3 removed, {result['mass']:.2f} g, "
+        f"{result['seconds']:.2f} s\n"
+    )
+    Recomputes.report()
+
+    if args.output:
+        doc.saveAs(os.path.abspath(args.output))
+    return result
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+import math
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import FreeCAD as App
+import Part
+
+# Above this, with enough cores and no GUI, split the face into tiles cut in separate processes
+TILED_CELLS = 4000
+TILED_MIN_WORKERS = 3
+# Below this a handful of sequential cuts is cheapest
+PER_CELL_CELLS = 8
+
+
+def cutCompound(base, tools, fuzzy=0.0):
+    """Single boolean: base minus one compound holding every tool."""
+    return base.cut(Part.makeCompound(tools), fuzzy)
+
+
+def cutFused(base, tools, fuzzy=0.0):
+    """Fuse the tools into one solid first, then cut once (like Part::MultiFuse + Part::Cut)."""
+    if len(tools) == 1:
+        tool = tools[0]
+    else:
+        tool = tools[0].multiFuse(tools[1:], fuzzy)
+    return base.cut(tool, fuzzy)
+
+
+def cutCells(base, tools, fuzzy=0.0):
+    """One boolean per tool."""
+    for tool in tools:
+        base = base.cut(tool, fuzzy)
+    return base
+
+
+def processPool(workers, initializer=None, initargs=()):
+    """
+    ProcessPoolExecutor of `workers` processes; initializer(*initargs) runs
+    once in each. Shared by cutTiled and Sweeps.sweep.
+    """
+    # fork keeps FreeCAD's modules loaded in the workers; spawn would re-run the GUI binary
+    methods = multiprocessing.get_all_start_methods()
+    context = multiprocessing.get_context("fork" if "fork" in methods else None)
+    return ProcessPoolExecutor(
+        max_workers=workers, mp_context=context, initializer=initializer, initargs=initargs
+    )
+
+
+def _cutTile(job):
+    """Worker: (tile piece BREP, tools BREP, fuzzy) -> BREP of the cut tile."""
+    pieceBrep, toolsBrep, fuzzy = job
+    piece = Part.Shape()
+    piece.importBrepFromString(pieceBrep)
+    if toolsBrep:
+        tools = Part.Shape()
+        tools.importBrepFromString(toolsBrep)
+        piece = piece.cut(tools, fuzzy)
+    return piece.exportBrepToString()
+
+
+def tileGrid(bound, count):
+    """
+    Split a BoundBox into about `count` boxes across its two largest extents.
+    Returns a list of (origin, size) tuples; the third axis is left whole.
+    """
+    # Pad every side so the outer tiles never share a face with the base
+    lengths = [bound.XLength + 2.0, bound.YLength + 2.0, bound.ZLength + 2.0]
+    mins = [bound.XMin - 1.0, bound.YMin - 1.0, bound.ZMin - 1.0]
+    first, second = sorted(range(3), key=lambda i: lengths[i], reverse=True)[:2]
+    ratio = lengths[first] / max(lengths[second], 1e-9)
+    n1 = max(1, round(math.sqrt(count * ratio)))
+    n2 = max(1, math.ceil(count / n1))
+
+    tiles = []
+    for i in range(n1):
+        for j in range(n2):
+            origin = list(mins)
+            size = list(lengths)
+            origin[first] += i * lengths[first] / n1
+            origin[second] += j * lengths[second] / n2
+            size[first] = lengths[first] / n1
+            size[second] = lengths[second] / n2
+            tiles.append((tuple(origin), tuple(size)))
+    return tiles
+
+
+def cutTiled(base, tools, fuzzy=0.0, tiles=None, workers=None):
+    """
+    Split base into rectangular tiles, cut each tile in its own process and
+    fuse the pieces back into one solid.
+    Forks the calling process (see processPool): choose() only picks this
+    without the GUI. Shapes cross process boundaries as BREP strings; each
+    tile receives its own piece of base and the tools whose bounding box
+    overlaps it.
+    """
+    workers = workers or os.cpu_count() or 1
+    tiles = tileGrid(base.BoundBox, tiles or workers)
+
+    jobs = []
+    for origin, size in tiles:
+        piece = base.common(Part.makeBox(*size, App.Vector(*origin)))
+        if not piece.Solids:
+            continue
+        box = piece.BoundBox
+        inside = [t for t in tools if box.intersect(t.BoundBox)]
+        toolsBrep = Part.makeCompound(inside).exportBrepToString() if inside else ""
+        jobs.append((piece.exportBrepToString(), toolsBrep, fuzzy))
+
+    with processPool(workers) as pool:
+        breps = list(pool.map(_cutTile, jobs))
+
+    pieces = []
+    for brep in breps:
+        piece = Part.Shape()
+        piece.importBrepFromString(brep)
+        if piece.Solids:
+            pieces.append(piece)
+    if not pieces:
+        return Part.Shape()
+    if len(pieces) == 1:
+        return pieces[0]
+    return pieces[0].multiFuse(pieces[1:], fuzzy).removeSplitter()
+
+
+STRATEGIES = {
+    "compound": cutCompound,
+    "fuse": cutFused,
+    "cells": cutCells,
+    "tiled": cutTiled,
+}
+
+
+def choose(cellCount):
+    """Pick a strategy from the number of tools."""
+    if cellCount <= PER_CELL_CELLS:
+        return "cells"
+    # Forking a live Qt event loop is unsafe: in the GUI "tiled" must be asked for
+    if cellCount >= TILED_CELLS and not App.GuiUp and (os.cpu_count() or 1) >= TILED_MIN_WORKERS:
+        return "tiled"
+    return "compound"
+
+
+def cut(base, tools, strategy="auto", fuzzy=0.0):
+    """
+    Cut `tools` (a list of shapes) out of `base` with the named strategy.
+    strategy="auto" picks one with choose(). `fuzzy` is OCC's fuzzy value,
+    useful when prism caps are coplanar with the base.
+    Returns (shape, strategy used).
+    """
+    tools = list(tools)
+    if not tools:
+        return base, "none"
+    if strategy == "auto":
+        strategy = choose(len(tools))
+    if strategy not in STRATEGIES:
+        raise ValueError(f"Unknown boolean strategy: {strategy!r}")
+    return STRATEGIES[strategy](base, tools, fuzzy), strategy
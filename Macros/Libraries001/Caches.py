@@ -0,0 +1,116 @@
+"""
+Content-addressed disk cache of finished shapes, shared by every document.
+
+Entries are BREP files named by shapeKey(): a hash of the source face's
+geometry and every pattern parameter, so the same face and parameters hit
+whichever document or session computed them. Reading an entry refreshes
+its mtime; put() evicts the least recently used entries beyond MAX_BYTES.
+"""
+import hashlib
+import os
+
+import FreeCAD as App
+import Part
+
+# Size cap of the cache folder
+MAX_BYTES = 512 * 1024 * 1024
+# Bump when the pipeline changes what a given key produces
+FORMAT = 1
+
+hits = 0
+misses = 0
+
+
+def folder():
+    """HONEYCOMB_CACHE, else Honeycomb/ in FreeCAD's user cache folder."""
+    path = os.environ.get("HONEYCOMB_CACHE")
+    if not path:
+        base = App.getUserCachePath() if hasattr(App, "getUserCachePath") else os.path.expanduser("~/.cache")
+        path = os.path.join(base, "Honeycomb")
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def shapeKey(face, **parameters):
+    """Hex digest of `face` (its BREP, placement included) and `parameters`."""
+    digest = hashlib.sha1(f"{FORMAT}\n".encode())
+    digest.update(face.exportBrepToString().encode())
+    for name in sorted(parameters):
+        digest.update(f"\n{name}={parameters[name]!r}".encode())
+    return digest.hexdigest()
+
+
+def _path(key):
+    return os.path.join(folder(), f"{key}.brep")
+
+
+def get(key):
+    """The cached Part.Shape for `key`, or None."""
+    global hits, misses
+    path = _path(key)
+    shape = None
+    if os.path.exists(path):
+        shape = Part.Shape()
+        try:
+            shape.importBrep(path)
+        except (OSError, Part.OCCError):
+            # Truncated or unreadable entry: a miss, put() overwrites it
+            shape = None
+    if shape is None or shape.isNull():
+        misses += 1
+        return None
+    os.utime(path)
+    hits += 1
+    return shape
+
+
+def put(key, shape):
+    """Store `shape` under `key` (written atomically), then trim the cache to MAX_BYTES."""
+    path = _path(key)
+    partial = f"{path}.{os.getpid()}.tmp"
+    shape.exportBrep(partial)
+    os.replace(partial, path)
+    evict()
+    return path
+
+
+def load(key, doc=None, name="Cut_OffsetA_minus_Hexagons", target=None):
+    """
+    Put the cached shape for `key` into `target`, or a new Part::Feature
+    `name` in doc. Returns the feature, or None on a miss.
+    """
+    shape = get(key)
+    if shape is None:
+        return None
+    feature = target or (doc or App.ActiveDocument).addObject("Part::Feature", name)
+    feature.Shape = shape
+    return feature
+
+
+def evict(maxBytes=None):
+    """Delete the least recently used entries until the folder fits `maxBytes` (default MAX_BYTES)."""
+    maxBytes = MAX_BYTES if maxBytes is None else maxBytes
+    entries = []
+    for entry in os.scandir(folder()):
+        if not entry.name.endswith(".brep"):
+            continue
+        stat = entry.stat()
+        entries.append((stat.st_mtime, stat.st_size, entry.path))
+    total = sum(size for _, size, _ in entries)
+    removed = 0
+    for _, size, path in sorted(entries):
+        if total <= maxBytes:
+            break
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        total -= size
+        removed += 1
+    return removed
+
+
+def clear():
+    """Empty the cache folder."""
+    return evict(0)
+
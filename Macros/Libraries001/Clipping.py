@@ -0,0 +1,247 @@
+import numpy as np
+
+OUTSIDE = 0
+BOUNDARY = 1
+INSIDE = 2
+
+# Upper bound on the (rows x edges) temporaries built per chunk
+CHUNK = 2_000_000
+
+
+def ringEdges(rings):
+    """Stack the edges of closed (M, 2) rings into start/end arrays."""
+    starts = np.vstack([np.asarray(r, dtype=float) for r in rings])
+    ends = np.vstack([np.roll(np.asarray(r, dtype=float), -1, axis=0) for r in rings])
+    return starts, ends
+
+
+def _chunks(count, edges):
+    step = max(1, CHUNK // max(1, edges))
+    for start in range(0, count, step):
+        yield slice(start, start + step)
+
+
+def pointsInRings(points, rings):
+    """
+    Even-odd test of (P, 2) points against the outer wire and any holes.
+    Ray crossings are computed once per distinct y, so lattice rows that
+    share a y value share the work.
+    """
+    points = np.asarray(points, dtype=float)
+    a, b = ringEdges(rings)
+    dy = b[:, 1] - a[:, 1]
+    dy = np.where(dy == 0, 1e-300, dy)
+    lo = min(a[:, 0].min(), b[:, 0].min()) - 1.0
+    hi = max(a[:, 0].max(), b[:, 0].max()) + 1.0
+    width = hi - lo + 1.0
+
+    ys, row = np.unique(points[:, 1], return_inverse=True)
+    order = np.argsort(row, kind="stable")
+    rowStarts = np.searchsorted(row[order], np.arange(len(ys) + 1))
+
+    inside = np.zeros(len(points), dtype=bool)
+    for s in _chunks(len(ys), len(a)):
+        y = ys[s, None]
+        crosses = (a[:, 1] > y) != (b[:, 1] > y)
+        crossRow, crossEdge = np.nonzero(crosses)
+        xCross = a[crossEdge, 0] + (ys[s][crossRow] - a[crossEdge, 1]) * (
+            b[crossEdge, 0] - a[crossEdge, 0]
+        ) / dy[crossEdge]
+
+        # Sort crossings by (row, x) through a single composite key
+        keys = np.sort(crossRow * width + (xCross - lo))
+        index = order[rowStarts[s.start]:rowStarts[min(s.stop, len(ys))]]
+        r = row[index] - s.start
+        px = np.clip(points[index, 0], lo, hi) - lo
+        atOrLeft = np.searchsorted(keys, r * width + px, side="right")
+        rowEnd = np.searchsorted(crossRow, r, side="right")
+        inside[index] = (rowEnd - atOrLeft) % 2 == 1
+    return inside
+
+
+def nearEdges(points, reach, rings):
+    """
+    Candidate (point, edge) pairs where a point may lie within `reach` of a
+    ring edge. Edges are sampled into a uniform bin grid and joined with the
+    points' bins, so no point is measured against every edge.
+    """
+    points = np.asarray(points, dtype=float)
+    size = 2.0 * float(np.max(reach))
+    origin = points.min(axis=0) - size
+    keys = np.floor((points - origin) / size).astype(np.int64)
+    shape = keys.max(axis=0) + 3
+    pointBins = keys[:, 0] * shape[1] + keys[:, 1]
+
+    a, b = ringEdges(rings)
+    lengths = np.linalg.norm(b - a, axis=1)
+    steps = np.ceil(lengths / (0.5 * size)).astype(np.int64) + 1
+    edge = np.repeat(np.arange(len(a)), steps)
+    # Zero-length edges (repeated ring points) get a single sample
+    first = np.repeat(np.cumsum(steps) - steps, steps)
+    t = (np.arange(steps.sum()) - first) / np.repeat(np.maximum(steps - 1, 1), steps)
+    samples = np.floor((a[edge] + t[:, None] * (b - a)[edge] - origin) / size).astype(np.int64)
+
+    # Every bin an edge passes through, plus its eight neighbours
+    edgeBins = []
+    for dx in (-1, 0, 1):
+        for dy in (-1, 0, 1):
+            i = np.clip(samples[:, 0] + dx, 0, shape[0] - 1)
+            j = np.clip(samples[:, 1] + dy, 0, shape[1] - 1)
+            edgeBins.append(i * shape[1] + j)
+    edgeBins = np.unique(np.column_stack([np.concatenate(edgeBins), np.tile(edge, 9)]), axis=0)
+
+    first = np.searchsorted(edgeBins[:, 0], pointBins, side="left")
+    last = np.searchsorted(edgeBins[:, 0], pointBins, side="right")
+    counts = last - first
+    pointIndex = np.repeat(np.arange(len(points)), counts)
+    offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    edgeIndex = edgeBins[np.repeat(first, counts) + offsets, 1]
+    return pointIndex, edgeIndex
+
+
+def _cross(o, p, q):
+    return (p[..., 0] - o[..., 0]) * (q[..., 1] - o[..., 1]) - (p[..., 1] - o[..., 1]) * (q[..., 0] - o[..., 0])
+
+
+def _crossesRings(cells, rings, cellIndex, edgeIndex):
+    """
+    True for each convex (C, K, 2) cell whose outline touches a ring,
+    testing only the candidate (cell, edge) pairs.
+    """
+    a, b = ringEdges(rings)
+    a = a[edgeIndex, None, :]
+    b = b[edgeIndex, None, :]
+    p0 = cells[cellIndex]
+    p1 = np.roll(cells, -1, axis=1)[cellIndex]
+    o1 = _cross(a, b, p0)
+    o2 = _cross(a, b, p1)
+    o3 = _cross(p0, p1, a)
+    o4 = _cross(p0, p1, b)
+    pairHit = ((o1 * o2 <= 0) & (o3 * o4 <= 0)).any(axis=1)
+    hit = np.bincount(cellIndex[pairHit], minlength=len(cells)) > 0
+
+    # A ring lying completely inside a cell (small hole) crosses no edge
+    ringPoints = np.vstack([np.asarray(r, dtype=float)[:1] for r in rings])
+    edgeStart = cells[:, None, :, :]
+    edgeEnd = np.roll(cells, -1, axis=1)[:, None, :, :]
+    side = _cross(edgeStart, edgeEnd, ringPoints[None, :, None, :])
+    contains = ((side >= 0).all(axis=2) | (side <= 0).all(axis=2)).any(axis=1)
+    return hit | contains
+
+
+def classifyCells(centers, cells, rings):
+    """
+    Label every cell as OUTSIDE, BOUNDARY or INSIDE the region bounded by
+    `rings` (outer wire first, then holes, each an (M, 2) polygon).
+
+    Cells whose circumcircle clears the outline are settled by their center
+    alone; only the few near the outline get the exact edge-crossing test.
+    """
+    centers = np.asarray(centers, dtype=float)
+    cells = np.asarray(cells, dtype=float)
+    labels = np.empty(len(centers), dtype=np.int8)
+    if not len(centers):
+        return labels
+    reach = np.linalg.norm(cells - centers[:, None, :], axis=2).max(axis=1)
+
+    labels[:] = np.where(pointsInRings(centers, rings), INSIDE, OUTSIDE)
+
+    pointIndex, edgeIndex = nearEdges(centers, reach, rings)
+    near, pairCell = np.unique(pointIndex, return_inverse=True)
+    if len(near):
+        crossing = _crossesRings(cells[near], rings, pairCell, edgeIndex)
+        labels[near[crossing]] = BOUNDARY
+        # Near but not crossing: every vertex is on the same side as the center
+        settled = near[~crossing]
+        labels[settled] = np.where(
+            pointsInRings(cells[settled, 0], rings), INSIDE, OUTSIDE
+        )
+    return labels
+
+
+def padCells(polygons, counts):
+    """
+    Padded (N, K, 2) cells from polygons with `counts` real vertices each:
+    slots past the count repeat the last real vertex, which leaves area,
+    centroid and edge tests unchanged.
+    """
+    k = polygons.shape[1]
+    index = np.minimum(np.arange(k)[None, :], np.maximum(counts, 1)[:, None] - 1)
+    return np.take_along_axis(polygons, index[..., None], axis=1)
+
+
+def cellAreas(cells):
+    """Signed shoelace area of each (N, K, 2) cell (positive when counter-clockwise)."""
+    nxt = np.roll(cells, -1, axis=1)
+    return 0.5 * (cells[..., 0] * nxt[..., 1] - nxt[..., 0] * cells[..., 1]).sum(axis=1)
+
+
+def cellCentroids(cells):
+    """Area centroid of each (N, K, 2) cell."""
+    nxt = np.roll(cells, -1, axis=1)
+    cross = cells[..., 0] * nxt[..., 1] - nxt[..., 0] * cells[..., 1]
+    area = 0.5 * cross.sum(axis=1)
+    area = np.where(np.abs(area) < 1e-300, 1e-300, area)
+    return ((cells + nxt) * cross[..., None]).sum(axis=1) / (6.0 * area[:, None])
+
+
+def clipHalfPlane(polygons, counts, normal, offset):
+    """
+    Sutherland-Hodgman clip of every convex polygon against its own half-plane
+    normal . p >= offset, vectorized over all polygons.
+    polygons (N, M, 2) with `counts` real vertices, normal (N, 2), offset (N,).
+    Returns (polygons (N, M', 2), counts).
+    """
+    n, m = polygons.shape[:2]
+    slot = np.arange(m)[None, :]
+    valid = slot < counts[:, None]
+    following = np.where(slot + 1 < counts[:, None], slot + 1, 0)
+    current = polygons
+    upcoming = np.take_along_axis(polygons, following[..., None], axis=1)
+
+    dCurrent = np.einsum("nmi,ni->nm", current, normal) - offset[:, None]
+    dUpcoming = np.einsum("nmi,ni->nm", upcoming, normal) - offset[:, None]
+    currentIn = dCurrent >= 0
+    crossing = valid & (currentIn != (dUpcoming >= 0))
+    keep = valid & currentIn
+
+    denominator = dCurrent - dUpcoming
+    t = dCurrent / np.where(denominator == 0, 1.0, denominator)
+    intersection = current + t[..., None] * (upcoming - current)
+
+    # Each vertex emits itself (if inside) followed by its edge crossing (if any)
+    emitted = keep.astype(np.int64) + crossing
+    newCounts = emitted.sum(axis=1)
+    start = np.cumsum(emitted, axis=1) - emitted
+    out = np.zeros((n, max(int(newCounts.max(initial=0)), 1), 2))
+    rows = np.broadcast_to(np.arange(n)[:, None], (n, m))
+    out[rows[keep], start[keep]] = current[keep]
+    out[rows[crossing], (start + keep)[crossing]] = intersection[crossing]
+    return out, newCounts
+
+
+def insetCells(cells, distance):
+    """
+    Shrink every convex, counter-clockwise (N, K, 2) cell by `distance` on
+    each edge (intersection of the inward-shifted edge half-planes).
+    Returns (cells, kept) where `kept` marks cells that did not collapse.
+    """
+    cells = np.asarray(cells, dtype=float)
+    edges = np.roll(cells, -1, axis=1) - cells
+    lengths = np.linalg.norm(edges, axis=2)
+    real = lengths > 1e-12
+    normals = np.stack([-edges[..., 1], edges[..., 0]], axis=2) / np.where(real, lengths, 1.0)[..., None]
+    offsets = np.einsum("nki,nki->nk", normals, cells) + distance
+
+    polygons = cells
+    counts = np.full(len(cells), cells.shape[1])
+    for k in range(cells.shape[1]):
+        # Repeated-vertex edges get an always-true half-plane
+        normal = np.where(real[:, k, None], normals[:, k], 0.0)
+        offset = np.where(real[:, k], offsets[:, k], -1.0)
+        polygons, counts = clipHalfPlane(polygons, counts, normal, offset)
+
+    kept = counts >= 3
+    polygons = padCells(polygons, counts)
+    kept &= cellAreas(polygons) > 1e-12
+    return polygons, kept
@@ -0,0 +1,123 @@
+"""
+Planar faces congruent up to a rigid motion (rotation and translation, no mirror).
+
+fingerprint() is a quantized summary that does not change under a rigid
+motion: surface type, loop and edge counts, area, sorted edge lengths and
+sorted distances of the vertices and edge midpoints from the centroid.
+Equal fingerprints are necessary, not sufficient, so groups() confirms
+every match with rigidTransform(), which recovers the 4x4 matrix taking
+one face onto the other.
+"""
+import hashlib
+import math
+
+import numpy as np
+import Part
+
+import Libraries001.Geometry as Geometry
+import Libraries001.Lattices as Lattices
+
+# Length quantum (mm): values straddling a step may miss a match, never make a wrong one
+TOLERANCE = 1e-3
+
+
+def _vector(v):
+    return np.array([v.x, v.y, v.z], dtype=float)
+
+
+def _quantize(values, step):
+    return tuple(int(q) for q in np.round(np.asarray(values, dtype=float) / step))
+
+
+def featurePoints(face):
+    """(M, 3) vertices followed by edge midpoints; the midpoints pin down arcs and circles."""
+    points = [_vector(v.Point) for v in face.Vertexes]
+    for edge in face.Edges:
+        first, last = edge.ParameterRange
+        points.append(_vector(edge.valueAt((first + last) / 2)))
+    return np.array(points, dtype=float).reshape(-1, 3)
+
+
+def fingerprint(face, tolerance=TOLERANCE):
+    """Hex digest shared by faces congruent under a rigid motion, within `tolerance` mm."""
+    distances = np.linalg.norm(featurePoints(face) - _vector(face.CenterOfMass), axis=1)
+    summary = (
+        type(face.Surface).__name__,
+        len(face.Wires),
+        len(face.Edges),
+        _quantize([math.sqrt(face.Area)], tolerance),
+        _quantize(sorted(edge.Length for edge in face.Edges), tolerance),
+        _quantize(np.sort(distances), tolerance),
+    )
+    return hashlib.sha1(repr(summary).encode()).hexdigest()
+
+
+def faceFrame(face):
+    """Lattices.planeFrame of a planar face, at its centroid."""
+    return Lattices.planeFrame(Geometry.faceNormal(face), _vector(face.CenterOfMass))
+
+
+def _frameMatrix(frame):
+    """4x4 matrix taking frame coordinates (u, v, n) to global ones."""
+    matrix = np.eye(4)
+    matrix[:3, 0], matrix[:3, 1], matrix[:3, 2], matrix[:3, 3] = frame[1], frame[2], frame[3], frame[0]
+    return matrix
+
+
+def rigidTransform(source, target, tolerance=TOLERANCE):
+    """
+    4x4 matrix of the rigid motion taking planar face `source` onto `target`
+    (normals matched, so no mirror), or None when they are not congruent.
+    """
+    if not (isinstance(source.Surface, Part.Plane) and isinstance(target.Surface, Part.Plane)):
+        return None
+    if abs(math.sqrt(source.Area) - math.sqrt(target.Area)) > tolerance:
+        return None
+    sourceFrame, targetFrame = faceFrame(source), faceFrame(target)
+    ps = Lattices.toPlane(featurePoints(source), sourceFrame)
+    pt = Lattices.toPlane(featurePoints(target), targetFrame)
+    if len(ps) != len(pt):
+        return None
+
+    # Every target point as far out as the outermost source point is a candidate image of it
+    rs, rt = np.linalg.norm(ps, axis=1), np.linalg.norm(pt, axis=1)
+    anchor = int(np.argmax(rs))
+    if rs[anchor] < tolerance:
+        angles = [0.0]
+    else:
+        start = math.atan2(ps[anchor, 1], ps[anchor, 0])
+        angles = [
+            math.atan2(q[1], q[0]) - start for q in pt[np.abs(rt - rs[anchor]) <= tolerance]
+        ]
+
+    for angle in angles:
+        c, s = math.cos(angle), math.sin(angle)
+        rotated = ps @ np.array([[c, s], [-s, c]])
+        gaps = np.linalg.norm(rotated[:, None, :] - pt[None, :, :], axis=2)
+        if gaps.min(axis=1).max() <= tolerance and gaps.min(axis=0).max() <= tolerance:
+            rotation = np.eye(4)
+            rotation[:2, :2] = [[c, -s], [s, c]]
+            return _frameMatrix(targetFrame) @ rotation @ np.linalg.inv(_frameMatrix(sourceFrame))
+    return None
+
+
+def groups(faces, tolerance=TOLERANCE):
+    """
+    Partition `faces` into congruence classes, in first-seen order. Each class
+    is a list of (index, matrix): the first entry is its representative with
+    the identity, the others carry the matrix moving the representative onto them.
+    """
+    byFingerprint = {}
+    classes = []
+    for index, face in enumerate(faces):
+        candidates = byFingerprint.setdefault(fingerprint(face, tolerance), [])
+        for members in candidates:
+            matrix = rigidTransform(faces[members[0][0]], face, tolerance)
+            if matrix is not None:
+                members.append((index, matrix))
+                break
+        else:
+            members = [(index, np.eye(4))]
+            candidates.append(members)
+            classes.append(members)
+    return classes
@@ -1,5 +1,7 @@
 import FreeCAD as App
 
+import Libraries001.Recomputes as Recomputes
+
 hexSeparation = 1
 hexExtrusion = -2
 hexRadius = 4
@@ -32,12 +34,8 @@ class Folders:
         if doc is None:
             raise RuntimeError("No active document.")
 
-        # Pause recompute while we shuffle the tree
-        had_autorecompute = getattr(doc, "AutoRecompute", True)
-        if hasattr(doc, "AutoRecompute"):
-            doc.AutoRecompute = False
-
-        try:
+        # One batch while we shuffle the tree: a single recompute on exit
+        with Recomputes.batch(doc, "Honeycomb folders"):
             # 1) Create or reuse the container
             existing = doc.getObject(container_name)
             if existing and (
@@ -90,10 +88,4 @@ class Folders:
                     binder_link.LinkedObject = binder
                 _safe_add(binder_link)
 
-            doc.recompute()
             return container, binder_link
-
-        finally:
-            if hasattr(doc, "AutoRecompute"):
-                doc.AutoRecompute = had_autorecompute
-            doc.recompute()
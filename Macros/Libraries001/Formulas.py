@@ -0,0 +1,70 @@
+import math
+import re
+
+import numpy as np
+
+# Input cells of the AutoGenerated sheet, by alias
+INPUTS = {
+    "radius": "B2",
+    "separation": "B3",
+    "width": "B4",
+    "length": "B5",
+}
+
+# Computed cells, in evaluation order. SpreadSheet.compute writes these exact strings.
+FORMULAS = {
+    "xInterval": ("E2", "=2*sin(60 deg)*(B2*2 + (B3 - 0.267949*B2))"),
+    "yInterval": ("E3", "=2*B2 + (B3 - 0.267949*B2)"),
+    "firstX": ("E4", "0"),
+    "firstY": ("E5", "0"),
+    "countX": ("E6", "=round(B5 / E2) + 2"),
+    "countY": ("E7", "=round(B4 / E3) + 2"),
+    "array2XPos": ("E8", "=sin(60 deg)*(B2*2 + B3 - 0.267949*B2)"),
+    "array2YPos": ("E9", "=E3/2"),
+    # NumberX / NumberY of the draft ortho arrays, as Lattices.hexCounts
+    "arrayCountX": ("E10", "=ceil(B5 / E2) + 1"),
+    "arrayCountY": ("E11", "=ceil(B4 / E3) + 1"),
+}
+
+_cell = re.compile(r"\b([A-Z]{1,2}[0-9]+)\b")
+_degrees = re.compile(r"([0-9.]+)\s*deg\b")
+
+
+def _round(x):
+    """FreeCAD's round(): halves away from zero."""
+    return np.sign(x) * np.floor(np.abs(x) + 0.5)
+
+
+def translate(formula):
+    """Python source for a sheet formula; cells become cells["B2"], angles are in degrees."""
+    source = formula[1:] if formula.startswith("=") else formula
+    source = _degrees.sub(lambda m: repr(math.radians(float(m.group(1)))), source)
+    return _cell.sub(lambda m: f'cells["{m.group(1)}"]', source)
+
+
+_compiled = {
+    alias: compile(translate(formula), f"<{alias}>", "eval")
+    for alias, (_, formula) in FORMULAS.items()
+}
+
+
+def evaluate(radius, separation, width=0.0, length=None):
+    """
+    Every AutoGenerated value for scalar or array parameters (broadcast with
+    NumPy), without a document. length defaults to width, as in compute().
+    Returns a dict by alias, inputs included.
+    """
+    values = {
+        "radius": np.asarray(radius, dtype=float),
+        "separation": np.asarray(separation, dtype=float),
+        "width": np.asarray(width, dtype=float),
+        "length": np.asarray(width if length is None else length, dtype=float),
+    }
+    shape = np.broadcast(*values.values()).shape
+    cells = {INPUTS[alias]: value for alias, value in values.items()}
+    namespace = {"sin": np.sin, "cos": np.cos, "ceil": np.ceil, "round": _round, "cells": cells}
+    for alias, (cell, _) in FORMULAS.items():
+        # Constant cells (firstX = 0) take the parameters' shape too
+        value = np.broadcast_to(eval(_compiled[alias], namespace), shape).astype(float)
+        cells[cell] = values[alias] = value
+    return values
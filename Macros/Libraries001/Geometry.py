@@ -0,0 +1,128 @@
+import numpy as np
+
+import Libraries001.Recomputes as Recomputes
+
+# Discretization used for edges and face loops in the cached bridge
+DEFLECTION = 0.1
+
+_cache = {}
+
+
+def faceLoops(face, deflection=DEFLECTION):
+    """
+    Boundary of a face as open (M, 3) point loops: outer wire first, then holes.
+    Curved edges are discretized to `deflection`.
+    """
+    outer = face.OuterWire
+    wires = [outer] + [w for w in face.Wires if not w.isSame(outer)]
+    return [
+        np.array([[p.x, p.y, p.z] for p in w.discretize(Deflection=deflection)])[:-1]
+        for w in wires
+    ]
+
+
+def faceNormal(face):
+    """Normal of a planar face as a (3,) array."""
+    normal = face.normalAt(0, 0)
+    return np.array([normal.x, normal.y, normal.z])
+
+
+def fitPlane(points):
+    """
+    Least-squares plane through (M, 3) points by PCA.
+    Returns (centroid (3,), unit normal (3,)); the normal is the direction of least spread.
+    """
+    points = np.asarray(points, dtype=float)
+    centroid = points.mean(axis=0)
+    _, _, vt = np.linalg.svd(points - centroid, full_matrices=False)
+    return centroid, vt[-1]
+
+
+def parentMatrix(obj):
+    """
+    4x4 matrix taking obj.Shape coordinates to global ones. The shape already
+    carries obj.Placement, so only the enclosing containers are applied.
+    """
+    placement = obj.getGlobalPlacement() if hasattr(obj, "getGlobalPlacement") else obj.Placement
+    parent = placement.multiply(obj.Placement.inverse())
+    return np.array(parent.toMatrix().A, dtype=float).reshape(4, 4)
+
+
+def _transform(points, matrix):
+    return points @ matrix[:3, :3].T + matrix[:3, 3]
+
+
+class ShapeArrays:
+    """
+    Global geometry of a document object as contiguous float64 arrays.
+    Vertices and face normals are read once on creation; edge polylines and
+    face loops are discretized on first use and kept.
+    """
+
+    def __init__(self, obj, deflection=DEFLECTION):
+        self.shape = obj.Shape
+        self.deflection = deflection
+        self.matrix = parentMatrix(obj)
+        points = [v.Point for v in self.shape.Vertexes]
+        self.vertices = _transform(
+            np.array([(p.x, p.y, p.z) for p in points], dtype=float).reshape(-1, 3), self.matrix
+        )
+        normals = []
+        for face in self.shape.Faces:
+            u0, u1, v0, v1 = face.ParameterRange
+            n = face.normalAt((u0 + u1) / 2, (v0 + v1) / 2)
+            normals.append((n.x, n.y, n.z))
+        self.faceNormals = np.array(normals, dtype=float).reshape(-1, 3) @ self.matrix[:3, :3].T
+        self._edges = None
+        self._loops = {}
+
+    @property
+    def edges(self):
+        """Every edge as an (M, 3) polyline."""
+        if self._edges is None:
+            self._edges = [
+                _transform(
+                    np.array([(p.x, p.y, p.z) for p in e.discretize(Deflection=self.deflection)]),
+                    self.matrix,
+                )
+                for e in self.shape.Edges
+            ]
+        return self._edges
+
+    def loops(self, index=0):
+        """faceLoops() of face `index`, in global coordinates."""
+        if index not in self._loops:
+            self._loops[index] = [
+                _transform(loop, self.matrix)
+                for loop in faceLoops(self.shape.Faces[index], self.deflection)
+            ]
+        return self._loops[index]
+
+
+def shapeState(obj):
+    """Cheap signature that changes whenever obj's shape or global placement does."""
+    shape = obj.Shape
+    box = shape.BoundBox
+    return (
+        shape.hashCode(),
+        (box.XMin, box.YMin, box.ZMin, box.XMax, box.YMax, box.ZMax),
+        tuple(parentMatrix(obj).ravel()),
+    )
+
+
+def shapeArrays(obj, deflection=DEFLECTION):
+    """
+    Cached ShapeArrays for `obj`, rebuilt only when its shape or placement
+    changes (see shapeState). A touched obj is recomputed first.
+    """
+    Recomputes.ensure(obj)
+    key = (obj.Document.Name, obj.Name, deflection)
+    state = shapeState(obj)
+    cached = _cache.get(key)
+    if cached is None or cached[0] != state:
+        cached = _cache[key] = (state, ShapeArrays(obj, deflection))
+    return cached[1]
+
+
+def clearCache():
+    _cache.clear()
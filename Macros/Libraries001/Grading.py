@@ -0,0 +1,115 @@
+import numpy as np
+
+import Libraries001.Lattices as Lattices
+
+# Neighbours blended when the field is given as scattered samples
+SAMPLE_NEIGHBOURS = 4
+
+
+def sampleField(field, points, bounds, frame=None):
+    """
+    Local cell radius at each (N, 2) lattice point, vectorized.
+    `field` may be:
+    - a number: uniform radius,
+    - a callable taking (N, 3) global points (or (N, 2) face points when
+      there is no frame) and returning (N,) radii,
+    - a 2D array of radii spanning `bounds`, rows along v and columns along u
+      (bilinear interpolation),
+    - a (points, values) pair of scattered samples, points (P, 3) global or
+      (P, 2) in the face frame (inverse-distance blend of the nearest ones).
+    """
+    points = np.asarray(points, dtype=float)
+    if np.isscalar(field):
+        return np.full(len(points), float(field))
+
+    if callable(field):
+        where = points if frame is None else Lattices.fromPlane(points, frame)
+        return np.broadcast_to(np.asarray(field(where), dtype=float), (len(points),)).copy()
+
+    if isinstance(field, tuple):
+        samples, values = (np.asarray(a, dtype=float) for a in field)
+        if samples.shape[1] == 3:
+            samples = Lattices.toPlane(samples, frame)
+        return _blend(samples, values, points)
+
+    grid = np.asarray(field, dtype=float)
+    return _bilinear(grid, points, bounds)
+
+
+def _bilinear(grid, points, bounds):
+    xMin, yMin, xMax, yMax = bounds
+    rows, columns = grid.shape
+    x = np.clip((points[:, 0] - xMin) / max(xMax - xMin, 1e-12) * (columns - 1), 0, columns - 1)
+    y = np.clip((points[:, 1] - yMin) / max(yMax - yMin, 1e-12) * (rows - 1), 0, rows - 1)
+    x0 = np.minimum(np.floor(x).astype(np.int64), max(columns - 2, 0))
+    y0 = np.minimum(np.floor(y).astype(np.int64), max(rows - 2, 0))
+    x1 = np.minimum(x0 + 1, columns - 1)
+    y1 = np.minimum(y0 + 1, rows - 1)
+    tx, ty = x - x0, y - y0
+    bottom = grid[y0, x0] * (1 - tx) + grid[y0, x1] * tx
+    top = grid[y1, x0] * (1 - tx) + grid[y1, x1] * tx
+    return bottom * (1 - ty) + top * ty
+
+
+def _blend(samples, values, points):
+    from scipy.spatial import cKDTree
+
+    k = min(SAMPLE_NEIGHBOURS, len(samples))
+    distance, index = cKDTree(samples).query(points, k=k)
+    distance = distance.reshape(len(points), k)
+    index = index.reshape(len(points), k)
+    weights = 1.0 / np.maximum(distance, 1e-12) ** 2
+    return (weights * values[index]).sum(axis=1) / weights.sum(axis=1)
+
+
+def levelOf(radius, local, levels):
+    """Finest level k whose radius / 2**k still fits the local radius (0 = coarsest)."""
+    ratio = radius / np.maximum(local, 1e-12)
+    return np.clip(np.ceil(np.log2(np.maximum(ratio, 1.0)) - 1e-9), 0, levels - 1).astype(np.int64)
+
+
+def _overlapping(centers, reach, keptCenters, keptReach, separation):
+    """True for each new cell whose circle (plus separation) meets a kept one."""
+    if not len(keptCenters) or not len(centers):
+        return np.zeros(len(centers), dtype=bool)
+    from scipy.spatial import cKDTree
+
+    pairs = cKDTree(centers).sparse_distance_matrix(
+        cKDTree(keptCenters), reach.max() + keptReach.max() + separation, output_type="ndarray"
+    )
+    clash = pairs["v"] < reach[pairs["i"]] + keptReach[pairs["j"]] + separation
+    return np.bincount(pairs["i"][clash], minlength=len(centers)) > 0
+
+
+@Lattices.register("gradedHexagons")
+def gradedHexLattice(radius, separation, bounds, field=None, levels=3, frame=None, **options):
+    """
+    Honeycomb whose cell size follows `field` (see sampleField).
+    `radius` is the largest cell; each finer level halves it. A cell of level k
+    is kept where the field asks for that level at its center, coarse levels
+    first, and finer cells that would come closer than `separation` to an
+    already kept cell are dropped, so cells never overlap.
+    Returns (centers (N, 2), cells (N, 6, 2)), like hexLattice.
+    """
+    if field is None:
+        return Lattices.hexLattice(radius, separation, bounds)
+
+    keptCenters, keptCells, keptReach = [], [], []
+    for level in range(levels):
+        levelRadius = radius / 2 ** level
+        centers, cells = Lattices.hexLattice(levelRadius, separation, bounds)
+        wanted = levelOf(radius, sampleField(field, centers, bounds, frame), levels) == level
+        centers, cells = centers[wanted], cells[wanted]
+        reach = np.full(len(centers), levelRadius)
+
+        if keptCenters:
+            clash = _overlapping(
+                centers, reach, np.vstack(keptCenters), np.concatenate(keptReach), separation
+            )
+            centers, cells, reach = centers[~clash], cells[~clash], reach[~clash]
+        keptCenters.append(centers)
+        keptCells.append(cells)
+        keptReach.append(reach)
+
+    return np.vstack(keptCenters), np.vstack(keptCells)
+
@@ -0,0 +1,181 @@
+import math
+
+import numpy as np
+
+SIN60 = math.sin(math.radians(60))
+
+
+def planeFrame(normal, origin=(0.0, 0.0, 0.0)):
+    """
+    Build an orthonormal frame for a planar face.
+    Rows are: origin, u axis, v axis, normal. The in-plane axes follow the
+    same convention as SpreadSheet.orientedBoundBox (u = n x Z, v = n x u).
+    """
+    n = np.asarray(normal, dtype=float)
+    n = n / np.linalg.norm(n)
+    u = np.cross(n, [0.0, 0.0, 1.0])
+    if np.linalg.norm(u) < 1e-12:
+        u = np.array([1.0, 0.0, 0.0])
+    u = u / np.linalg.norm(u)
+    v = np.cross(n, u)
+    v = v / np.linalg.norm(v)
+    return np.vstack([np.asarray(origin, dtype=float), u, v, n])
+
+
+def toPlane(points, frame):
+    """Project (..., 3) global points into (..., 2) frame coordinates."""
+    points = np.asarray(points, dtype=float)
+    return (points - frame[0]) @ frame[1:3].T
+
+
+def fromPlane(uv, frame, w=0.0):
+    """Lift (..., 2) frame coordinates back to (..., 3) global points, w along the normal."""
+    uv = np.asarray(uv, dtype=float)
+    return frame[0] + uv[..., 0, None] * frame[1] + uv[..., 1, None] * frame[2] + w * frame[3]
+
+
+def hexPitch(radius, separation):
+    """
+    Column (x) and row (y) pitch of the staggered honeycomb.
+    Same numbers as the AutoGenerated xInterval / yInterval formulas.
+    """
+    yInterval = 2 * radius + (separation - 0.267949 * radius)
+    xInterval = 2 * SIN60 * yInterval
+    return xInterval, yInterval
+
+
+def regularPolygon(radius, sides, start=0.0):
+    """Vertices (sides, 2) of a regular polygon, first vertex at `start` degrees."""
+    angles = np.radians(start + np.arange(sides) * 360.0 / sides)
+    return radius * np.column_stack([np.cos(angles), np.sin(angles)])
+
+
+def hexagon(radius):
+    """Vertices (6, 2) of a Part::RegularPolygon hexagon: first vertex on +X."""
+    return regularPolygon(radius, 6)
+
+
+GENERATORS = {}
+
+
+def register(name):
+    """Decorator adding a generator(radius, separation, bounds, **options) -> (centers, cells)."""
+    def decorator(function):
+        GENERATORS[name] = function
+        return function
+    return decorator
+
+
+def generate(name, radius, separation, bounds, **options):
+    """Run the registered generator `name`; every generator returns (centers (N, 2), cells (N, K, 2))."""
+    if name not in GENERATORS:
+        raise ValueError(f"Unknown lattice: {name!r} (known: {', '.join(sorted(GENERATORS))})")
+    return GENERATORS[name](radius, separation, bounds, **options)
+
+
+def tile(bounds, u, v, motifs):
+    """
+    Repeat `motifs` over the lattice i*u + j*v and keep every cell touching
+    `bounds` = (xMin, yMin, xMax, yMax). u must be horizontal (v[1] > 0).
+    motifs: list of (offset (2,), shape (K, 2)) placed at each lattice point;
+    all shapes share the same K.
+    Returns (centers (N, 2), cells (N, K, 2)).
+    """
+    xMin, yMin, xMax, yMax = bounds
+    reach = max(np.abs(shape).max() + np.abs(offset).max() for offset, shape in motifs)
+
+    j = np.arange(math.floor((yMin - reach) / v[1]) - 1, math.ceil((yMax + reach) / v[1]) + 1)
+    shift = j * v[0]
+    i = np.arange(math.floor((xMin - reach - shift.max()) / u[0]) - 1,
+                  math.ceil((xMax + reach - shift.min()) / u[0]) + 1)
+    I, J = np.meshgrid(i, j, indexing="ij")
+    points = np.column_stack([I.ravel() * u[0] + J.ravel() * v[0], J.ravel() * v[1]])
+
+    centers, cells = [], []
+    for offset, shape in motifs:
+        motifCenters = points + offset
+        radius = np.abs(shape).max()
+        keep = (
+            (motifCenters[:, 0] + radius >= xMin)
+            & (motifCenters[:, 0] - radius <= xMax)
+            & (motifCenters[:, 1] + radius >= yMin)
+            & (motifCenters[:, 1] - radius <= yMax)
+        )
+        motifCenters = motifCenters[keep]
+        centers.append(motifCenters)
+        cells.append(motifCenters[:, None, :] + np.asarray(shape)[None, :, :])
+    return np.vstack(centers), np.vstack(cells)
+
+
+@register("hexagons")
+def hexLattice(radius, separation, bounds, **options):
+    """
+    Every honeycomb cell touching `bounds` = (xMin, yMin, xMax, yMax).
+
+    Row 1 sits on (i*xInterval, j*yInterval) and row 2 is shifted by half a
+    pitch in both directions, exactly like the two Draft ortho arrays.
+    Returns (centers (N, 2), cells (N, 6, 2)).
+    """
+    xInterval, yInterval = hexPitch(radius, separation)
+    shape = hexagon(radius)
+    return tile(
+        bounds,
+        (xInterval, 0.0),
+        (0.0, yInterval),
+        [(np.zeros(2), shape), (np.array([xInterval / 2, yInterval / 2]), shape)],
+    )
+
+
+@register("squares")
+def squareLattice(radius, separation, bounds, **options):
+    """Axis-aligned squares of circumradius `radius`, `separation` apart."""
+    pitch = math.sqrt(2) * radius + separation
+    return tile(bounds, (pitch, 0.0), (0.0, pitch), [(np.zeros(2), regularPolygon(radius, 4, 45.0))])
+
+
+@register("diamonds")
+def diamondLattice(radius, separation, bounds, **options):
+    """Squares turned 45 degrees (vertices on the axes), `separation` apart across each edge."""
+    pitch = 2 * radius + math.sqrt(2) * separation
+    shape = regularPolygon(radius, 4)
+    return tile(
+        bounds,
+        (pitch, 0.0),
+        (0.0, pitch),
+        [(np.zeros(2), shape), (np.array([pitch / 2, pitch / 2]), shape)],
+    )
+
+
+@register("triangles")
+def triangleLattice(radius, separation, bounds, **options):
+    """
+    Alternating up/down equilateral triangles of circumradius `radius`.
+    Parallel edges of neighbours are `separation` apart.
+    """
+    # Neighbours across an edge sit 2 * inradius + separation = radius + separation apart
+    spacing = radius + separation
+    pitch = math.sqrt(3) * spacing
+    return tile(
+        bounds,
+        (pitch, 0.0),
+        (pitch / 2, 1.5 * spacing),
+        [
+            (np.zeros(2), regularPolygon(radius, 3, 90.0)),
+            (np.array([pitch / 2, spacing / 2]), regularPolygon(radius, 3, 270.0)),
+        ],
+    )
+
+
+@register("circles")
+def circleLattice(radius, separation, bounds, segments=24, **options):
+    """Hex-packed round holes of `radius` (as `segments`-gons), `separation` apart."""
+    pitch = 2 * radius + separation
+    return tile(bounds, (pitch, 0.0), (pitch / 2, SIN60 * pitch), [(np.zeros(2), regularPolygon(radius, segments))])
+
+
+def hexCounts(radius, separation, width, length):
+    """NumberX / NumberY for each of the two ortho arrays covering width x length."""
+    xInterval, yInterval = hexPitch(radius, separation)
+    countX = math.ceil(length / xInterval) + 1
+    countY = math.ceil(width / yInterval) + 1
+    return countX, countY
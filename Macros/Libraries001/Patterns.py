@@ -1,12 +1,17 @@
 import math
 
-import Draft
 import FreeCAD as App
-import FreeCADGui as Gui
+import Part
 import numpy as np
-from PySide import QtCore
-import matplotlib.pyplot as plt
-from Librs.Transformation import Points
+import Libraries001.Booleans as Booleans
+import Libraries001.Clipping as Clipping
+import Libraries001.Geometry as Geometry
+import Libraries001.Grading as Grading  # registers the "gradedHexagons" lattice
+import Libraries001.Lattices as Lattices
+import Libraries001.Prisms as Prisms
+import Libraries001.Recomputes as Recomputes
+import Libraries001.Surfaces as Surfaces
+import Libraries001.Voronoi as Voronoi  # registers the "voronoi" lattice
 
 hexSeparation = 1
 hexExtrusion = -2
@@ -14,22 +19,306 @@ hexRadius = 4
 planeOffset = -3
 userSheetLabel = "EditMe"
 autoGeneratedLabel = "AutoGenerated"
+# Closer cells share edges, and a plate face with them as holes is invalid (mm)
+MIN_SEPARATION = 1e-3
 
 
-class HexagonalPattern:
-    def __init__(self, userSheet, autoGeneratedSheet, offset2D, type):
+class LatticePattern:
+    """
+    Cell pattern on the Offset2D face, generated by the registered lattice
+    named `type` (see Lattices.GENERATORS). Every pattern shares the same
+    back end: classify() culls, cut() clips against the outline, and
+    create() builds the prisms straight from the cell arrays.
+    """
+
+    def __init__(self, userSheet, autoGeneratedSheet, offset2D, type, **options):
         self.autoGeneratedSheet = autoGeneratedSheet
-        self.type = type or "hexagons"
+        self.type = type
         self.userSheet = userSheet
         self.offset2D = offset2D
+        self.options = options
         self.fusedArrays = None
+        self.centers = None
+        self.cells = None
+        self.labels = None
+        self.mode = "direct"
+
+    def lattice(self):
+        """
+        Compute every cell covering the Offset2D face in one pass.
+        Geometry lives in the face's own (u, v) frame (self.frame):
+        self.centers is (N, 2) and self.cells is (N, K, 2).
+        """
+        Recomputes.ensure(self.userSheet)
+        radius = float(self.userSheet.radius)
+        separation = float(self.userSheet.separation)
+        self.projectFace()
+        self.centers, self.cells = Lattices.generate(
+            self.type, radius, separation, self.bounds, rings=self.rings, frame=self.frame, **self.options
+        )
+        self.labels = None
+        return self.centers, self.cells
+
+    def sourceFace(self):
+        """The face the Offset2D was made from (its binder's), which may be curved."""
+        source = getattr(self.offset2D, "Source", None) or self.offset2D
+        Recomputes.ensure(source)
+        return source.Shape.Faces[0]
+
+    def projectFace(self):
+        """Set self.frame, self.rings (outer wire first, then holes) and self.bounds from the Offset2D face."""
+        arrays = Geometry.shapeArrays(self.offset2D)
+        loops = arrays.loops(0)
+        self.frame = Lattices.planeFrame(arrays.faceNormals[0], loops[0].mean(axis=0))
+        self.rings = [Lattices.toPlane(loop, self.frame) for loop in loops]
+        uv = self.rings[0]
+        self.bounds = (*uv.min(axis=0), *uv.max(axis=0))
+        return self.rings
+
+    def classify(self):
+        """
+        Label each lattice cell INSIDE, BOUNDARY or OUTSIDE the Offset2D
+        outline (see Clipping.classifyCells). Stored in self.labels.
+        """
+        if self.cells is None:
+            self.lattice()
+        self.labels = Clipping.classifyCells(self.centers, self.cells, self.rings)
+        return self.labels
+
+    def cut(self, length=None, strategy="auto", fuzzy=0.0):
+        """
+        Offset2D plate minus the honeycomb, built straight from the classified lattice:
+        - outside cells are dropped,
+        - inside cells become plain holes in the plate face (no boolean),
+        - only boundary cells are cut by OCC, through Booleans.cut(strategy, fuzzy).
+        After latticeMapped() the thickened source face is cut by every inside cell.
+        The result is a single Part::Feature named Cut_OffsetA_minus_Hexagons.
+        """
+        height = float(self.userSheet.height) if length is None else float(length)
+        plate, tools = self.solids(*self.placeCells(height), height)
+        result = self.cutSolids(plate, tools, strategy, fuzzy)
+
+        cut = App.ActiveDocument.addObject("Part::Feature", "Cut_OffsetA_minus_Hexagons")
+        cut.Shape = result
+        return cut
+
+    def placeCells(self, height):
+        """
+        Classified cells in global coordinates: (inside, boundary) as (N, K, 3)
+        arrays. Boundary cells start 10% of `height` below the face so their
+        prisms overshoot both caps and the cut stays off coplanar faces.
+        After latticeMapped(): (bases, directions) of the inside cells, see
+        Surfaces.tangentCells.
+        """
+        if self.labels is None:
+            self.classify()
+        if self.frame is None:
+            inside = self.labels == Clipping.INSIDE
+            return Surfaces.tangentCells(self.surfaceMap, self.centers[inside], self.cells[inside], height)
+        inside = Lattices.fromPlane(self.cells[self.labels == Clipping.INSIDE], self.frame)
+        boundary = Lattices.fromPlane(
+            self.cells[self.labels == Clipping.BOUNDARY], self.frame, w=-0.1 * height
+        )
+        return inside, boundary
+
+    def solids(self, inside, boundary, height):
+        """
+        (plate with the inside cells as holes, boundary prisms), extruded `height` along the face normal.
+        After latticeMapped(): (source face thickened by `height`, one prism per inside cell).
+        Raises ValueError when the separation is too small for holes that do not touch.
+        """
+        if self.frame is None:
+            plate = self.sourceFace().makeOffsetShape(height, 1e-3, fill=True)
+            return plate, Prisms.prismsAlong(inside, boundary)
+        separation = float(self.userSheet.separation)
+        if separation <= MIN_SEPARATION:
+            raise ValueError(
+                f"Separation {separation} mm leaves no wall between cells: it must exceed {MIN_SEPARATION} mm."
+            )
+        direction = App.Vector(*self.frame[3]) * height
+        Recomputes.ensure(self.offset2D)
+        face = self.offset2D.Shape.Faces[0]
+        plate = Part.Face(face.Wires + [Prisms.wire(c) for c in inside], "Part::FaceMakerBullseye")
+        return plate.extrude(direction), Prisms.prisms(boundary, direction * 1.2)
+
+    def blankVolume(self, height):
+        """Volume of the plate solids() starts from, before any cell is taken out of it."""
+        if self.frame is None:
+            return self.sourceFace().makeOffsetShape(height, 1e-3, fill=True).Volume
+        Recomputes.ensure(self.offset2D)
+        return self.offset2D.Shape.Faces[0].extrude(App.Vector(*self.frame[3]) * height).Volume
+
+    def cutSolids(self, plate, tools, strategy="auto", fuzzy=0.0):
+        """Plate minus the boundary prisms through Booleans.cut; sets self.strategy."""
+        result, self.strategy = Booleans.cut(plate, tools, strategy=strategy, fuzzy=fuzzy)
+        return result
+
+    def create(self, mode="direct"):
+        if mode not in ("direct", "uv", "link"):
+            raise ValueError(f"{type(self).__name__} only supports the direct, uv and link build modes.")
+        self.mode = mode
+        if mode == "uv":
+            return self.createMapped()
+        if mode == "link":
+            return self.createLinked()
+        return self.createDirect()
+
+    def latticeMapped(self, face=None, samples=Surfaces.SAMPLES):
+        """
+        Lay the lattice out in the (u, v) parameter space of `face` (default:
+        the source face, which may be curved) and classify it against the
+        face's trimmed boundary. Coordinates are parameters scaled to mm,
+        see Surfaces.SurfaceMap; self.frame is None in this mode.
+        """
+        Recomputes.ensure(self.userSheet)
+        face = face or self.sourceFace()
+        radius = float(self.userSheet.radius)
+        separation = float(self.userSheet.separation)
+        self.surfaceMap = Surfaces.SurfaceMap(face, samples)
+        self.frame = None
+        self.rings = self.surfaceMap.rings()
+        self.bounds = self.surfaceMap.bounds()
+        self.centers, self.cells = Lattices.generate(
+            self.type, radius, separation, self.bounds, rings=self.rings, frame=None, **self.options
+        )
+        self.labels = Clipping.classifyCells(self.centers, self.cells, self.rings)
+        return self.centers, self.cells
+
+    def createMapped(self, face=None, length=None, samples=Surfaces.SAMPLES):
+        """
+        Prisms for every cell fully inside the face, mapped onto the surface in
+        one batched evaluation. Each cell is flattened onto the tangent plane
+        at its center and extruded along the local normal, deep enough to cover
+        the surface sag, so the compound cuts cleanly on cylinders and freeform faces.
+        """
+        self.latticeMapped(face, samples)
+        height = float(self.userSheet.height) if length is None else float(length)
+        inside = self.labels == Clipping.INSIDE
+        bases, directions = Surfaces.tangentCells(
+            self.surfaceMap, self.centers[inside], self.cells[inside], height
+        )
+
+        compound = App.ActiveDocument.addObject("Part::Feature", "HoneycombCompound")
+        compound.Shape = Part.makeCompound(Prisms.prismsAlong(bases, directions))
+        if compound.ViewObject:
+            compound.ViewObject.Visibility = False
+
+        self.fusedArrays = compound
+        return compound
+
+    def keptCells(self, length=None):
+        """
+        The cells to build, outside ones skipped when classify() has already
+        run, as (cells (N, K, 2), shapes: cells less their centers, offsets of
+        the centers from the frame origin (N, 3), extrusion direction).
+        Raises ValueError when no cell is left.
+        """
+        if self.cells is None:
+            self.lattice()
+        height = float(self.userSheet.height) if length is None else float(length)
+        direction = App.Vector(*self.frame[3]) * height
+
+        centers, cells = self.centers, self.cells
+        if self.labels is not None:
+            keep = self.labels != Clipping.OUTSIDE
+            centers, cells = centers[keep], cells[keep]
+        if not len(cells):
+            raise ValueError("No lattice cell lies on the face: reduce radius or separation.")
+        offsets = Lattices.fromPlane(centers, self.frame) - self.frame[0]
+        return cells, cells - centers[:, None, :], offsets, direction
+
+    def createDirect(self, length=None):
+        """
+        One Part.Compound of prisms from the lattice arrays, stored in a single
+        Part::Feature. When every cell is a translated copy of the first, the
+        cells are located copies of one prototype prism sharing its geometry.
+        Outside cells are skipped when classify() has already run.
+        """
+        cells, shapes, offsets, direction = self.keptCells(length)
+        compound = App.ActiveDocument.addObject("Part::Feature", "HoneycombCompound")
+        if np.allclose(shapes, shapes[0]):
+            prototype = Prisms.prisms([Lattices.fromPlane(shapes[0], self.frame)], direction)[0]
+            compound.Shape = Prisms.instanced(prototype, offsets)
+        else:
+            compound.Shape = Prisms.compound(Lattices.fromPlane(cells, self.frame), direction)
+        if compound.ViewObject:
+            compound.ViewObject.Visibility = False
+
+        self.fusedArrays = compound
+        return compound
+
+    def createLinked(self, length=None):
+        """
+        Instanced cells: one hidden prototype prism per distinct cell shape
+        (one for uniform lattices) and one App::Link array per prototype whose
+        ElementCount / PlacementList place every copy. ShowElement is off, so
+        no per-cell objects exist in the tree, the file or the scene graph.
+        Outside cells are skipped when classify() has already run.
+        """
+        _, shapes, offsets, direction = self.keptCells(length)
+        _, first, group = np.unique(
+            np.round(shapes, 6).reshape(len(shapes), -1), axis=0, return_index=True, return_inverse=True
+        )
+        group = group.ravel()
+        rotation = App.Rotation()
+
+        doc = App.ActiveDocument
+        links = []
+        with Recomputes.batch(doc, "Honeycomb links"):
+            for index, cell in enumerate(first):
+                prototype = doc.addObject("Part::Feature", "HoneycombCell")
+                prototype.Shape = Prisms.prisms([Lattices.fromPlane(shapes[cell], self.frame)], direction)[0]
+                link = doc.addObject("App::Link", "HoneycombCells")
+                link.setLink(prototype)
+                link.ShowElement = False
+                link.ElementCount = int((group == index).sum())
+                link.PlacementList = [App.Placement(App.Vector(*o), rotation) for o in offsets[group == index]]
+                if App.GuiUp:
+                    prototype.ViewObject.Visibility = False
+                    link.ViewObject.Visibility = False
+                links.append(link)
+
+            if len(links) == 1:
+                self.fusedArrays = links[0]
+            else:
+                self.fusedArrays = doc.addObject("Part::Compound", "HoneycombCompound")
+                self.fusedArrays.Links = links
+                if App.GuiUp:
+                    self.fusedArrays.ViewObject.Visibility = False
+        return self.fusedArrays
+
+    def align(self, reference, target=None):
+        # Direct prisms are built in the face frame already
+        return target or self.fusedArrays
+
+    def extrude(self, length=None):
+        # Direct mode already produced solid prisms
+        return self.fusedArrays
+
+
+class HexagonalPattern(LatticePattern):
+    """
+    Honeycomb pattern; adds the parametric Draft ortho-array build on top of LatticePattern.
+    With a `field` (see Grading.sampleField) the cell size is graded: `radius`
+    becomes the largest cell and each of the `levels` finer sizes halves it.
+    """
+
+    def __init__(self, userSheet, autoGeneratedSheet, offset2D, type, field=None, levels=3):
+        if field is None:
+            super().__init__(userSheet, autoGeneratedSheet, offset2D, type or "hexagons")
+        else:
+            super().__init__(
+                userSheet, autoGeneratedSheet, offset2D, "gradedHexagons", field=field, levels=levels
+            )
         self.K = []
+        self.mode = "draft"
 
     def row_alignment(self):
         """
-        Bakes the alignment from self.fusedArrays (the compound) directly 
-        into self.row1 and self.row2, clears conflicting local expressions 
-        to avoid dependency cycles (DAG errors), and deletes the compound container.
+        Bakes the placement of self.fusedArrays (the compound) into self.row1
+        and self.row2 and resets the compound to identity, so the rows carry
+        the alignment on their own. Local expressions that would feed back
+        into the rows (DAG errors) are cleared. One recompute, nothing deleted.
         """
         if not self.fusedArrays:
             raise ValueError("self.fusedArrays does not exist. Run align() first.")
@@ -37,16 +326,13 @@ class HexagonalPattern:
             raise ValueError("Row1 and Row2 must be initialized.")
 
         doc = App.ActiveDocument
-        
-        # 1) Recompute so FreeCAD stabilizes the children's global matrices
-        doc.recompute()
-
-        # 2) Capture the final calculated global placements of both rows
-        row1_global = self.row1.getGlobalPlacement()
-        row2_global = self.row2.getGlobalPlacement()
+        # row2's placement follows the sheet: stale until recomputed inside a batch
+        Recomputes.ensure(self.row1, self.row2, self.fusedArrays)
+        placement = self.fusedArrays.Placement
+        row1Placement = placement.multiply(self.row1.Placement)
+        row2Placement = placement.multiply(self.row2.Placement)
 
-        # 3) Clear the placement expressions on row2 to break the feedback loop
-        # This prevents the "The graph must be a DAG" dependency cycle error
+        # Clear the placement expressions on row2 to break the feedback loop
         if hasattr(self.row2, "ExpressionEngine"):
             self.row2.setExpression("Placement.Base.x", None)
             self.row2.setExpression("Placement.Base.y", None)
@@ -56,37 +342,45 @@ class HexagonalPattern:
             row.setExpression("IntervalX.x", None)
             row.setExpression("IntervalY.y", None)
 
-        # 4) Dismantle the compound links so deleting it leaves the rows alone
-        compound_name = self.fusedArrays.Name
-        self.fusedArrays.Links = []
-        doc.recompute()
-
-        # 5) Delete the compound container safely
-        doc.removeObject(compound_name)
-        self.fusedArrays = None  
-        doc.recompute()
-
-        # 6) Now it is completely safe to permanently bake the global positions
-        self.row1.Placement = row1_global
-        self.row2.Placement = row2_global
-        
-        doc.recompute()
+        self.row1.Placement = row1Placement
+        self.row2.Placement = row2Placement
+        self.fusedArrays.Placement = App.Placement()
+
+        Recomputes.recompute(doc)
         return self.row1, self.row2
 
-    def create(self):
+    def create(self, mode="draft"):
+        """
+        Build the honeycomb.
+        - "draft":  RegularPolygon -> two expanded ortho arrays -> Part::Compound
+                    (parametric, aligned afterwards with align()).
+        - "direct": prisms built straight from the lattice arrays into one
+                    Part::Feature, already placed on the face; no align() needed.
+        - "uv":     like "direct", but laid out in the face's parameter space,
+                    so the face may be cylindrical or freeform.
+        - "link":   one prototype prism instanced by an App::Link array
+                    (ElementCount / PlacementList); light on tree, file and Coin.
+        """
+        if mode in ("direct", "uv", "link"):
+            return super().create(mode)
+        if mode != "draft":
+            raise ValueError(f"Unknown create mode: {mode!r}")
+        if self.type != "hexagons":
+            raise ValueError(f"The draft build only makes uniform hexagons, not {self.type!r}.")
+
+        import Draft
+
+        self.mode = mode
         doc = App.ActiveDocument
 
-        # ---- Defer recomputes until the end
-        had_autorc = getattr(doc, "AutoRecompute", True)
-        if hasattr(doc, "AutoRecompute"):
-            doc.AutoRecompute = False
-        try:
+        # ---- One undo step, one recompute and one redraw for the whole build
+        with Recomputes.batch(doc, "Honeycomb arrays"):
+            self.lattice()
+
             hexagon = doc.addObject("Part::RegularPolygon", "HoneycombHexagon")
             hexagon.Polygon = 6
             hexagon.setExpression("Circumradius", f"{userSheetLabel}.radius")
-            doc.recompute()
 
-            self.hexagon = np.array([[v.X, v.Y, v.Z] for v in hexagon.Shape.Vertexes])
             row1 = Draft.make_ortho_array(
                 hexagon,
                 v_x=App.Vector(1, 0, 0),
@@ -117,92 +411,55 @@ class HexagonalPattern:
             for arr in (row1, row2):
                 arr.setExpression("IntervalX.x", f"{autoGeneratedLabel}.xInterval")  # type: ignore
                 arr.setExpression("IntervalY.y", f"{autoGeneratedLabel}.yInterval")  # type: ignore
-                arr.setExpression("NumberX", f"{autoGeneratedLabel}.countX")  # type: ignore
-                arr.setExpression("NumberY", f"{autoGeneratedLabel}.countY")  # type: ignore
+                # ceil(B5/E2)+1 rather than the over-provisioned round(B5/E2)+2
+                arr.setExpression("NumberX", f"{autoGeneratedLabel}.arrayCountX")  # type: ignore
+                arr.setExpression("NumberY", f"{autoGeneratedLabel}.arrayCountY")  # type: ignore
 
             # 4) Use a Compound instead of a MultiFuse (faster, enough for cutting)
             compound = doc.addObject("Part::Compound", "HoneycombCompound")
             compound.Links = [row1, row2]  # accepts arrays/links directly
 
-            hexagon.ViewObject.Visibility = False
-            row1.ViewObject.Visibility = False  # type: ignore
-            row2.ViewObject.Visibility = False  # type: ignore
-
-        finally:
-            if hasattr(doc, "AutoRecompute"):
-                doc.AutoRecompute = had_autorc
-            doc.recompute()  # one-shot recompute
+            if App.GuiUp:
+                hexagon.ViewObject.Visibility = False
+                row1.ViewObject.Visibility = False  # type: ignore
+                row2.ViewObject.Visibility = False  # type: ignore
 
+        # Inside an outer batch nothing has been recomputed yet
+        Recomputes.ensure(hexagon)
+        self.hexagon = np.array([[v.X, v.Y, v.Z] for v in hexagon.Shape.Vertexes])
         self.fusedArrays = compound
         return compound
 
-
     def align(self, reference, target=None):
+        if self.mode != "draft":
+            return super().align(reference, target)
         if target is None:
             target = self.fusedArrays
-        referencePlacement = reference.getGlobalPlacement()
-        targetPlacement = target.getGlobalPlacement()
-
-        referenceFace = reference.Shape.Faces[0]
-        referenceWire = referenceFace.OuterWire
-        referencePoints = np.array([
-            [referencePlacement.multVec(v.Point).x,
-            referencePlacement.multVec(v.Point).y,
-            referencePlacement.multVec(v.Point).z]
-            for v in referenceWire.Vertexes
-        ])
-
-
-        targetPoints = np.array([
-            [targetPlacement.multVec(v.Point).x,
-            targetPlacement.multVec(v.Point).y,
-            targetPlacement.multVec(v.Point).z]
-            for v in list(target.Shape.Vertexes)[:4]
-        ])
-        
-        N = min(len(referencePoints), len(targetPoints))
-        referencePoints = referencePoints[:N]
-        targetPoints = targetPoints[:N]
-
-        if len(referencePoints) != len(targetPoints):
-            raise RuntimeError(
-                f"Point count mismatch: reference={len(referencePoints)}, target={len(targetPoints)}"
-            )
 
-        referenceMean = referencePoints.mean(axis=0)
-        targetMean = targetPoints.mean(axis=0)
-        P = referencePoints - referenceMean
-        Q = targetPoints - targetMean
-
-        H = Q.T @ P
-        U, S, Vt = np.linalg.svd(H)
-        R = Vt.T @ U.T
-        if np.linalg.det(R) < 0:
-            Vt[-1, :] *= -1
-            R = Vt.T @ U.T
-
-        m = App.Matrix(
-            R[0,0], R[0,1], R[0,2], 0,
-            R[1,0], R[1,1], R[1,2], 0,
-            R[2,0], R[2,1], R[2,2], 0,
-            0,      0,      0,      1
-        )
-        rot = App.Rotation(m)
-
-        targetVector = App.Vector(*targetMean)
-        referenceVector = App.Vector(*referenceMean)
-        translation = referenceVector - rot.multVec(targetVector)
-        target.Placement = App.Placement(translation, rot)
-        referenceCenter = reference.Shape.CenterOfGravity
-        targetCenter = target.Shape.CenterOfGravity
-        placement = target.Placement
-        placement.Base = placement.Base.add(referenceCenter.sub(targetCenter))
-        target.Placement = placement
-        App.ActiveDocument.recompute()
+        # PCA plane through every boundary point of the reference face
+        arrays = Geometry.shapeArrays(reference)
+        centroid, normal = Geometry.fitPlane(np.vstack(arrays.loops(0)))
+        if normal @ arrays.faceNormals[0] < 0:
+            normal = -normal
+        frame = Lattices.planeFrame(normal, centroid)
+
+        # The arrays start at their first cell center: put it on the low corner of the Offset2D outline
+        outline = Geometry.shapeArrays(self.offset2D or reference).loops(0)[0]
+        anchor = Lattices.fromPlane(Lattices.toPlane(outline, frame).min(axis=0), frame)
+
+        u, v, n = frame[1], frame[2], frame[3]
+        target.Placement = App.Placement(App.Matrix(
+            u[0], v[0], n[0], anchor[0],
+            u[1], v[1], n[1], anchor[1],
+            u[2], v[2], n[2], anchor[2],
+            0, 0, 0, 1,
+        ))
+        Recomputes.recompute(App.ActiveDocument)
         return target
 
-
     def extrude(self, length=None):
+        if self.mode != "draft":
+            return super().extrude(length)
         extruded = App.ActiveDocument.addObject("Part::Extrusion", "Extruded")
         extruded.Base = self.fusedArrays
         extruded.DirMode = "Normal"
@@ -236,164 +493,13 @@ class HexagonalPattern:
         return baseRotation.multiply(target)
 
 
-class VoroniPattern():
-    def __init__(self, userSheet, autoGeneratedSheet, offset2D, type):
-        self.autoGeneratedSheet = autoGeneratedSheet
-        self.type = type or "hexagons"
-        self.userSheet = userSheet
-        self.offset2D = offset2D
-        self.fusedArrays = None
-        self.K = []
+class VoroniPattern(LatticePattern):
+    """
+    Voronoi infill of the Offset2D face (see Voronoi.voronoiLattice).
+    Cells are sized like `radius` hexagons and spaced `separation` apart.
+    """
 
-    def create(self):
-        doc = App.ActiveDocument
-
-        # ---- Defer recomputes until the end
-        had_autorc = getattr(doc, "AutoRecompute", True)
-        if hasattr(doc, "AutoRecompute"):
-            doc.AutoRecompute = False
-        try:
-            # 1) Hex profile driven by user sheet
-            hexagon = doc.addObject("Part::RegularPolygon", "HoneycombHexagon")
-            hexagon.Polygon = 6
-            hexagon.setExpression("Circumradius", f"{userSheetLabel}.radius")
-                    # recompute to make shape usable
-            doc.recompute()
-
-            self.hexagon = np.array([[v.X, v.Y, v.Z] for v in hexagon.Shape.Vertexes])
-            row1 = Draft.make_ortho_array(
-                hexagon,
-                v_x=App.Vector(1, 0, 0),
-                v_y=App.Vector(0, 1, 0),
-                n_x=1,
-                n_y=1,
-                use_link=True,
-            )
-
-            row2 = Draft.make_ortho_array(
-                hexagon,
-                v_x=App.Vector(1, 0, 0),
-                v_y=App.Vector(0, 1, 0),
-                n_x=1,
-                n_y=1,
-                use_link=True,
-            )
-
-            row2.setExpression("Placement.Base.x", f"{autoGeneratedLabel}.array2XPos")  # type: ignore
-            row2.setExpression("Placement.Base.y", f"{autoGeneratedLabel}.array2YPos")  # type: ignore
-
-            for arr in (row1, row2):
-                arr.setExpression("IntervalX.x", f"{autoGeneratedLabel}.xInterval")  # type: ignore
-                arr.setExpression("IntervalY.y", f"{autoGeneratedLabel}.yInterval")  # type: ignore
-                arr.setExpression("NumberX", f"{autoGeneratedLabel}.countX")  # type: ignore
-                arr.setExpression("NumberY", f"{autoGeneratedLabel}.countY")  # type: ignore
-
-            # 4) Use a Compound instead of a MultiFuse (faster, enough for cutting)
-            compound = doc.addObject("Part::Compound", "HoneycombCompound")
-            compound.Links = [row1, row2]  # accepts arrays/links directly
-
-            hexagon.ViewObject.Visibility = False
-            row1.ViewObject.Visibility = False  # type: ignore
-            row2.ViewObject.Visibility = False  # type: ignore
-
-        finally:
-            if hasattr(doc, "AutoRecompute"):
-                doc.AutoRecompute = had_autorc
-            doc.recompute()  # one-shot recompute
-
-        self.fusedArrays = compound
-        return compound
-
-    def align(self, reference, target=None):
-        if target is None:
-            target = self.fusedArrays
-        referencePlacement = reference.getGlobalPlacement()
-        targetPlacement = target.getGlobalPlacement()
-
-        referenceFace = reference.Shape.Faces[0]
-        referenceWire = referenceFace.OuterWire
-        referencePoints = np.array([
-            [referencePlacement.multVec(v.Point).x,
-            referencePlacement.multVec(v.Point).y,
-            referencePlacement.multVec(v.Point).z]
-            for v in referenceWire.Vertexes
-        ])
-
-        referencePoints = referencePoints[::2]
-        targetPoints = np.array([
-            [targetPlacement.multVec(v.Point).x,
-            targetPlacement.multVec(v.Point).y,
-            targetPlacement.multVec(v.Point).z]
-            for v in list(target.Shape.Vertexes)[:4]
-        ])
-
-        if len(referencePoints) != len(targetPoints):
-            raise RuntimeError(
-                f"Point count mismatch: reference={len(referencePoints)}, target={len(targetPoints)}"
-            )
-
-        referenceMean = referencePoints.mean(axis=0)
-        targetMean = targetPoints.mean(axis=0)
-        P = referencePoints - referenceMean
-        Q = targetPoints - targetMean
-
-        H = Q.T @ P
-        U, S, Vt = np.linalg.svd(H)
-        R = Vt.T @ U.T
-        if np.linalg.det(R) < 0:
-            Vt[-1, :] *= -1
-            R = Vt.T @ U.T
-
-        m = App.Matrix(
-            R[0,0], R[0,1], R[0,2], 0,
-            R[1,0], R[1,1], R[1,2], 0,
-            R[2,0], R[2,1], R[2,2], 0,
-            0,      0,      0,      1
+    def __init__(self, userSheet, autoGeneratedSheet, offset2D, type, iterations=2, seed=0):
+        super().__init__(
+            userSheet, autoGeneratedSheet, offset2D, type or "voronoi", iterations=iterations, seed=seed
         )
-        rot = App.Rotation(m)
-
-        targetVector = App.Vector(*targetMean)
-        referenceVector = App.Vector(*referenceMean)
-        translation = referenceVector - rot.multVec(targetVector)
-        target.Placement = App.Placement(translation, rot)
-        referenceCenter = reference.Shape.CenterOfGravity
-        targetCenter = target.Shape.CenterOfGravity
-        placement = target.Placement
-        placement.Base = placement.Base.add(referenceCenter.sub(targetCenter))
-        target.Placement = placement
-        App.ActiveDocument.recompute()
-
-        return target
-
-
-    def extrude(self, length=None):
-        extruded = App.ActiveDocument.addObject("Part::Extrusion", "Extruded")
-        extruded.Base = self.fusedArrays
-        extruded.DirMode = "Normal"
-        extruded.Solid = True
-
-        if length is None:
-            # Bind directly to spreadsheet value (userSheetLabel.height)
-            extruded.setExpression("LengthFwd", f"{self.userSheet.Label}.height")
-            extruded.LengthRev = 0  # avoid conflict
-        else:
-            # Handle explicit numeric input
-            extruded.LengthFwd = length if length > 0 else 0
-            extruded.LengthRev = -length if length < 0 else 0
-
-        return extruded
-
-    @staticmethod
-    def getGlobalRotation(plane):
-        globalRotation = getattr(plane, "getGlobalPlacement", None)
-        if callable(globalRotation):
-            return globalRotation().Rotation  # type: ignore
-        return plane.Placement.Rotation
-
-    @staticmethod
-    def getDeltaRotation(reference, target):
-        baseRotation = App.Rotation(reference)
-        baseRotation.invert()
-        return baseRotation.multiply(target)
-    
-    
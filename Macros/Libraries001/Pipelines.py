@@ -0,0 +1,373 @@
+"""
+The honeycomb build as named stages with declared inputs:
+
+    binder -> offset -> sheet -> lattice -> align -> extrude -> cut
+
+Each stage result is memoized per document on a hash of its inputs
+(parameter values and the keys of the stages it reads), so a rerun only
+executes the stages downstream of what changed: a new separation starts
+at lattice, a new height at align. Stages that own document objects update
+the previous ones in place instead of adding more.
+
+Before the lattice stage the finished cut is also looked up by content
+(bound face plus SHAPE_INPUTS) in the disk cache, see Caches: a variant
+computed before, in any document, loads instead of being rebuilt. The
+boolean strategy does not change the shape and is not a SHAPE_INPUT, so
+with the cache on a strategy-only change reuses the existing cut; with
+cache=False it reruns the cut stage.
+"""
+import hashlib
+import itertools
+import time
+
+import FreeCAD as App
+import Part
+
+import Libraries001.Caches as Caches
+import Libraries001.Clipping as Clipping
+import Libraries001.Fingerprints as Fingerprints
+import Libraries001.Geometry as Geometry
+import Libraries001.Patterns as Patterns
+import Libraries001.Planes as Planes
+import Libraries001.Recomputes as Recomputes
+import Libraries001.Spreadsheets as Spreadsheets
+
+# (stage, inputs): an input is a parameter or an earlier stage
+STAGES = (
+    ("binder", ("source", "subname", "sourceState")),
+    ("offset", ("binder", "planeOffset", "mode")),
+    ("sheet", ("offset",)),
+    ("lattice", ("offset", "sheet", "hexRadius", "hexSeparation", "type", "options", "mode")),
+    ("align", ("lattice", "hexExtrusion")),
+    ("extrude", ("align", "hexExtrusion")),
+    ("cut", ("extrude", "strategy")),
+)
+
+# What the finished cut depends on besides the bound face: the disk cache key (see restore)
+SHAPE_INPUTS = ("hexRadius", "hexSeparation", "hexExtrusion", "planeOffset", "type", "options", "mode")
+# "direct": flat lattice on the Offset2D inset; "uv": lattice in the bound face's
+# parameter space (see LatticePattern.latticeMapped), for curved faces
+MODES = ("direct", "uv")
+
+# (document name, slot, stage) -> (key, result, serial of the result);
+# (document name, slot, "shape") -> cache key of the shape in the cut feature
+_memo = {}
+_serials = itertools.count()
+
+
+def _token(value):
+    """Hashable stand-in for a stage input: document objects by name, containers recursively."""
+    if hasattr(value, "TypeId") and hasattr(value, "Document"):
+        return ("object", value.Document.Name, value.Name)
+    if isinstance(value, dict):
+        return tuple(sorted((k, _token(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_token(v) for v in value)
+    return repr(value)
+
+
+def digest(*values):
+    return hashlib.sha1(repr(_token(values)).encode()).hexdigest()
+
+
+def _plain(value):
+    """True for numbers, strings, None and containers of them, whose repr is stable."""
+    if isinstance(value, dict):
+        return all(isinstance(k, str) and _plain(v) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return all(_plain(v) for v in value)
+    return value is None or isinstance(value, (bool, int, float, str))
+
+
+def _alive(doc, obj):
+    try:
+        return doc.getObject(obj.Name) is not None
+    except Exception:
+        return False
+
+
+def clear(doc=None):
+    """Forget the memoized stages of `doc` (default: every document)."""
+    for key in [k for k in _memo if doc is None or k[0] == doc.Name]:
+        del _memo[key]
+
+
+class HoneycombPipeline:
+    """
+    Cut a `type` lattice (see Lattices.GENERATORS) into one face of `doc`.
+    run() executes the stages that are stale and returns the cut feature;
+    self.executed lists the stages it ran. Pipelines with different `slot`s
+    memoize separately, so several faces of one document keep their own objects.
+    `mode` "uv" lays the lattice out on the bound face itself, which may be
+    curved, instead of on its planar Offset2D inset (see MODES).
+    """
+
+    def __init__(self, doc=None, type="hexagons", cache=True, slot="", sharedSheet=False, mode="direct", **options):
+        if mode not in MODES:
+            raise ValueError(f"Unknown pipeline mode: {mode!r}")
+        self.doc = doc or App.ActiveDocument
+        self.mode = mode
+        self.slot = slot
+        # Several faces: the caller lays out AutoGenerated once, see honeycombFaces
+        self.sharedSheet = sharedSheet
+        self.type = type
+        self.options = options
+        # Options such as a grading field callable have no stable hash across sessions
+        self.cache = cache and _plain(options)
+        self.shapeKey = None
+        self.executed = []
+        self.recomputes = 0
+        self.results = {}
+
+    def run(self, source=None, subname=None, strategy="auto", **parameters):
+        """
+        Build on `source` / `subname` (default: the GUI selection) with the
+        Spreadsheets parameters (hexRadius, hexSeparation, hexExtrusion,
+        planeOffset) overridden by `parameters`. With the cache on, a cut
+        already on disk for this face and these parameters (see Caches) is
+        loaded in place of the lattice, align, extrude and cut stages.
+        """
+        if source is None:
+            source, subname = Planes.selectedFace()
+        Recomputes.ensure(source)
+
+        # Start from EditMe so parameters not given keep the user's values
+        sheet = Spreadsheets.SpreadSheet()
+        sheet.load(self.doc)
+        for name, value in parameters.items():
+            if not hasattr(sheet, name):
+                raise ValueError(f"Unknown pipeline parameter: {name}")
+            setattr(sheet, name, value)
+        values = {
+            "source": source,
+            "subname": subname,
+            "sourceState": Geometry.shapeState(source),
+            "hexRadius": sheet.hexRadius,
+            "hexSeparation": sheet.hexSeparation,
+            "hexExtrusion": sheet.hexExtrusion,
+            "planeOffset": sheet.planeOffset,
+            "type": self.type,
+            "options": self.options,
+            "mode": self.mode,
+            "strategy": strategy,
+        }
+
+        self.executed = []
+        keys = {}
+        before = len(Recomputes.records)
+        with Recomputes.batch(self.doc, "Honeycomb"):
+            self.spreadsheet = sheet
+            # Only differing cells are written, so unchanged parameters touch nothing
+            self.userSheet = sheet.userSpreadSheet()
+            try:
+                for name, inputs in STAGES:
+                    if name == "lattice" and self.cache and self.restore(values):
+                        break
+                    keys[name] = self.runStage(name, inputs, keys, values)
+            except BaseException:
+                # The batch aborts its transaction: objects made so far are gone
+                clear(self.doc)
+                raise
+        self.recomputes = len(Recomputes.records) - before
+        return self.results["cut"]
+
+    def parameters(self):
+        """The parameters run() would use without overrides: EditMe's, else the defaults."""
+        return Spreadsheets.SpreadSheet().load(self.doc)
+
+    def memoKey(self, stage):
+        return (self.doc.Name, self.slot, stage)
+
+    def restore(self, values):
+        """
+        Before the lattice stage: True when the cut for this face and these
+        parameters is already in the document or was loaded from the disk cache.
+        """
+        binder = self.results["binder"]
+        Recomputes.ensure(binder)
+        self.shapeKey = Caches.shapeKey(
+            binder.Shape,
+            placement=Geometry.parentMatrix(binder).ravel().tolist(),
+            **{name: values[name] for name in SHAPE_INPUTS},
+        )
+        cached = _memo.get(self.memoKey("cut"))
+        feature = cached[1] if cached and _alive(self.doc, cached[1]) else None
+        if feature is not None and _memo.get(self.memoKey("shape")) == self.shapeKey:
+            self.results["cut"] = feature
+            return True
+        feature = Caches.load(self.shapeKey, self.doc, target=feature)
+        if feature is None:
+            return False
+        # The memoized stages no longer describe the feature: the cut stage must run next time
+        _memo[self.memoKey("cut")] = (None, feature, next(_serials))
+        _memo[self.memoKey("shape")] = self.shapeKey
+        self.results["cut"] = feature
+        self.executed.append("cache")
+        return True
+
+    def runStage(self, name, inputs, keys, values):
+        """Reuse or execute stage `name`; returns its key for the stages that read it."""
+        key = digest(name, [keys[i] if i in keys else values[i] for i in inputs])
+        cached = _memo.get(self.memoKey(name))
+        previous = cached[1] if cached else None
+        if hasattr(previous, "TypeId") and not _alive(self.doc, previous):
+            previous = cached = None
+        if cached and cached[0] == key:
+            result, serial = previous, cached[2]
+        else:
+            with Recomputes.stage(f"Pipelines.{name}"):
+                result = getattr(self, name)(
+                    previous, *(self.results[i] if i in keys else values[i] for i in inputs)
+                )
+            # A new result (even a recreated object under its old name) makes later stages stale
+            serial = cached[2] if cached and result is previous else next(_serials)
+            _memo[self.memoKey(name)] = (key, result, serial)
+            self.executed.append(name)
+        self.results[name] = result
+        return digest(key, serial)
+
+    def binder(self, previous, source, subname, sourceState):
+        if previous is None:
+            return Planes.Plane().createShapeBinder(source, subname)
+        if list(previous.Support) != [(source, (subname,))]:
+            previous.Support = [(source, subname)]
+        return previous
+
+    def offset(self, previous, binder, planeOffset, mode):
+        if mode == "uv":
+            # The face is used as bound: a planar inset does not apply to a curved face
+            if previous is not None and previous is not binder and _alive(self.doc, previous):
+                self.doc.removeObject(previous.Name)
+            return binder
+        # planeOffset reaches the Offset2D through its EditMe expression
+        if previous is None or previous is binder:
+            return Planes.Plane().createOffset2D(binder)
+        if previous.Source != binder:
+            previous.Source = binder
+        return previous
+
+    def sheet(self, previous, offset):
+        if self.sharedSheet:
+            return self.spreadsheet.create(Spreadsheets.autoGeneratedLabel)
+        return self.spreadsheet.compute(offset2D=offset)
+
+    def lattice(self, previous, offset, sheet, hexRadius, hexSeparation, type, options, mode):
+        pattern = Patterns.LatticePattern(self.userSheet, sheet, offset, type, **options)
+        if mode == "uv":
+            pattern.latticeMapped()
+        else:
+            pattern.lattice()
+            pattern.classify()
+        return pattern
+
+    def align(self, previous, lattice, hexExtrusion):
+        return lattice.placeCells(float(hexExtrusion))
+
+    def extrude(self, previous, align, hexExtrusion):
+        return self.results["lattice"].solids(*align, float(hexExtrusion))
+
+    def cut(self, previous, extrude, strategy):
+        result = self.results["lattice"].cutSolids(*extrude, strategy=strategy)
+        feature = previous or self.doc.addObject("Part::Feature", "Cut_OffsetA_minus_Hexagons")
+        feature.Shape = result
+        if self.cache:
+            Caches.put(self.shapeKey, result)
+            _memo[self.memoKey("shape")] = self.shapeKey
+        return feature
+
+
+def faceSlot(source, subname):
+    return f"{source.Name}.{subname}"
+
+
+def honeycombFaces(
+    faces=None, doc=None, type="hexagons", strategy="auto", cache=True, options=None, mode="direct", **parameters
+):
+    """
+    Honeycomb every (object, subname) in `faces` (default: every selected face)
+    in one batch: one undo step and one final recompute, with one EditMe and
+    one AutoGenerated sheet shared by all faces. Congruent faces (see
+    Fingerprints.groups) are built once: the representative of a class runs
+    the pipeline, every other member gets a Part::Feature sharing that cut's
+    geometry, moved by the rigid placement between the two faces.
+    `mode` is passed to every HoneycombPipeline ("uv" for curved faces).
+    Returns the combined report printed by faceReport().
+    """
+    doc = doc or App.ActiveDocument
+    faces = faces or Planes.selectedFaces()
+    start = time.perf_counter()
+    before = len(Recomputes.records)
+    for source, _ in faces:
+        Recomputes.ensure(source)
+    shapes = [Part.getShape(source, subname, needSubElement=True) for source, subname in faces]
+    classes = Fingerprints.groups(shapes)
+
+    rows = [None] * len(faces)
+    offsets = []
+    with Recomputes.batch(doc, "Honeycomb faces"):
+        for members in classes:
+            built = time.perf_counter()
+            source, subname = faces[members[0][0]]
+            representative = faceSlot(source, subname)
+            pipeline = HoneycombPipeline(
+                doc, type, cache, representative, sharedSheet=True, mode=mode, **(options or {})
+            )
+            cut = pipeline.run(source, subname, strategy=strategy, **parameters)
+            offsets.append(pipeline.results["offset"])
+            pattern = pipeline.results.get("lattice")
+            rows[members[0][0]] = {
+                "face": representative,
+                "representative": representative,
+                "feature": cut.Name,
+                "stages": list(pipeline.executed),
+                "cells": None if pattern is None else int((pattern.labels != Clipping.OUTSIDE).sum()),
+                "seconds": time.perf_counter() - built,
+            }
+
+            for index, matrix in members[1:]:
+                placed = time.perf_counter()
+                source, subname = faces[index]
+                key = (doc.Name, faceSlot(source, subname), "cut")
+                cached = _memo.get(key)
+                feature = cached[1] if cached and _alive(doc, cached[1]) else None
+                feature = feature or doc.addObject("Part::Feature", "Cut_OffsetA_minus_Hexagons")
+                shape = cut.Shape.copy(False)
+                shape.Placement = App.Placement(App.Matrix(*matrix.ravel())).multiply(shape.Placement)
+                feature.Shape = shape
+                # Not built from this face's stages: its own pipeline must recompute the cut
+                _memo[key] = (None, feature, next(_serials))
+                rows[index] = {
+                    **rows[members[0][0]],
+                    "face": faceSlot(source, subname),
+                    "feature": feature.Name,
+                    "stages": ["placed"],
+                    "seconds": time.perf_counter() - placed,
+                }
+
+        # One AutoGenerated layout for every face: sized for the largest outline
+        Recomputes.ensure(*offsets)
+        largest = max(offsets, key=lambda o: o.Shape.BoundBox.DiagonalLength)
+        Spreadsheets.SpreadSheet().compute(offset2D=largest)
+
+    return {
+        "faces": rows,
+        "classes": len(classes),
+        "recomputes": len(Recomputes.records) - before,
+        "seconds": time.perf_counter() - start,
+    }
+
+
+def faceReport(report):
+    """Print a honeycombFaces() report to the report view; returns it."""
+    for row in report["faces"]:
+        cells = "-" if row["cells"] is None else row["cells"]
+        via = "" if row["face"] == row["representative"] else f" (copy of {row['representative']})"
+        App.Console.PrintMessage(
+            f"{row['face']:<24} {row['feature']:<32} {cells:>6} cells "
+            f"{row['seconds'] * 1000:>9.1f} ms  {', '.join(row['stages']) or 'up to date'}{via}\n"
+        )
+    App.Console.PrintMessage(
+        f"{len(report['faces'])} faces, {report['classes']} built, "
+        f"{report['recomputes']} recomputes, {report['seconds']:.2f} s\n"
+    )
+    return report
@@ -1,5 +1,6 @@
 import FreeCAD as App
-import FreeCADGui as Gui
+
+import Libraries001.Recomputes as Recomputes
 
 hexSeparation = 1
 hexExtrusion = -2
@@ -9,6 +10,26 @@ userSheetLabel = "EditMe"
 autoGeneratedLabel = "AutoGenerated"
 
 
+def selectedFaces():
+    """(object, subname) of every face selected in the GUI, in selection order."""
+    import FreeCADGui as Gui
+
+    faces = [
+        (sel.Object, name)
+        for sel in Gui.Selection.getSelectionEx()
+        for name in sel.SubElementNames
+        if name.rsplit(".", 1)[-1].startswith("Face")
+    ]
+    if not faces:
+        raise Exception("Error: Select a face to create the honeycomb grid on.")
+    return faces
+
+
+def selectedFace():
+    """(object, subname) of the first face selected in the GUI."""
+    return selectedFaces()[0]
+
+
 class Plane:
     def __init__(self):
         self.subShapeBinder = None
@@ -16,15 +37,14 @@ class Plane:
 
         pass
 
-    def createShapeBinder(self):
-        sel_ex = Gui.Selection.getSelectionEx()
-        if not sel_ex or not sel_ex[0].SubElementNames:
-            raise Exception("Error: Select a face to create the honeycomb grid on.")
-
+    def createShapeBinder(self, src_obj=None, subname=None):
+        """
+        Bind the face to build on: `src_obj` / `subname` (e.g. Pad, "Face6")
+        when given, which also works headless, otherwise the GUI selection.
+        """
         self.doc = App.ActiveDocument
-        sel = sel_ex[0]
-        src_obj = sel.Object
-        subname = sel.SubElementNames[0]
+        if src_obj is None:
+            src_obj, subname = selectedFace()
 
         def findBody(o):
             visited = set()
@@ -48,7 +68,8 @@ class Plane:
             binder = self.doc.addObject("PartDesign::SubShapeBinder", "Binder")
 
         binder.Support = [(src_obj, subname)]  # Fixed to link to source object face
-        binder.ViewObject.Visibility = False
+        if binder.ViewObject:
+            binder.ViewObject.Visibility = False
         self.subShapeBinder = binder
         return binder
 
@@ -58,8 +79,9 @@ class Plane:
         self.offset2D = offset2D
         offset2D.Source = subShapeBinder
         offset2D.setExpression("Value", f"{userSheetLabel}.planeOffset")
-        App.activeDocument().recompute()
-        offset2D.ViewObject.Visibility = False
+        Recomputes.recompute(App.activeDocument())
+        if offset2D.ViewObject:
+            offset2D.ViewObject.Visibility = False
         return offset2D
     
     def extrude(self, shape, length=None, spreadsheet=None):
@@ -0,0 +1,37 @@
+import FreeCAD as App
+import numpy as np
+import Part
+
+
+def wire(cell):
+    """Closed polygon wire through a (K, 3) cell, skipping repeated vertices."""
+    cell = np.asarray(cell, dtype=float)
+    keep = np.any(np.abs(cell - np.roll(cell, 1, axis=0)) > 1e-9, axis=1)
+    points = [App.Vector(*p) for p in cell[keep]]
+    return Part.makePolygon(points + points[:1])
+
+
+def prisms(cells, direction):
+    """One solid per (K, 3) cell, extruded along `direction` (an App.Vector)."""
+    return [Part.Face(wire(cell)).extrude(direction) for cell in cells]
+
+
+def prismsAlong(cells, directions):
+    """One solid per (K, 3) cell, each extruded along its own (N, 3) direction."""
+    return [Part.Face(wire(cell)).extrude(App.Vector(*d)) for cell, d in zip(cells, directions)]
+
+
+def compound(cells, direction):
+    """All (N, K, 3) cells as a single Part.Compound of prisms."""
+    return Part.makeCompound(prisms(cells, direction))
+
+
+def instanced(prototype, offsets):
+    """
+    Compound of located copies of one prototype shape, one per (N, 3) offset.
+    Every copy shares the prototype's geometry; only its location differs.
+    """
+    rotation = App.Rotation()
+    return Part.makeCompound(
+        [prototype.moved(App.Placement(App.Vector(*o), rotation)) for o in offsets]
+    )
@@ -0,0 +1,172 @@
+import collections
+import contextlib
+import sys
+import time
+
+import FreeCAD as App
+
+# Recompute calls a stage may make before report() flags it
+BUDGET = 1
+# Per-stage overrides of BUDGET, e.g. {"Folders.create": 2}
+budgets = {}
+
+Record = collections.namedtuple("Record", "stage touched recomputed seconds")
+records = []
+_stages = []
+# Open batches per document name: [depth, saved AutoRecompute, pending ViewFit]
+_batches = {}
+
+
+@contextlib.contextmanager
+def stage(name):
+    """Attribute every recompute inside the block to `name` instead of the calling function."""
+    _stages.append(name)
+    try:
+        yield
+    finally:
+        _stages.pop()
+
+
+def _caller(depth):
+    frame = sys._getframe(depth)
+    module = frame.f_globals.get("__name__", "?").rsplit(".", 1)[-1]
+    return f"{module}.{getattr(frame.f_code, 'co_qualname', frame.f_code.co_name)}"
+
+
+def recompute(doc=None, stage=None):
+    """
+    doc.recompute(), recorded with its stage (the innermost stage() block, or
+    the calling Module.function), the number of touched objects before the
+    call and its wall time. Returns what doc.recompute() returns.
+    Inside a batch() the call is deferred to the end of the outermost batch.
+    """
+    doc = doc or App.ActiveDocument
+    if doc.Name in _batches:
+        return 0
+    return _recompute(doc, stage or (_stages[-1] if _stages else _caller(2)))
+
+
+def _recompute(doc, name, objects=None):
+    touched = sum(1 for o in (objects or doc.Objects) if o.isTouched())
+    start = time.perf_counter()
+    recomputed = doc.recompute(objects) if objects else doc.recompute()
+    records.append(Record(name, touched, recomputed, time.perf_counter() - start))
+    return recomputed
+
+
+def ensure(*objects):
+    """
+    Bring `objects` (and what they depend on) up to date before reading their
+    shape or values. Only touched objects are recomputed, so this is free
+    outside a batch and a partial recompute inside one.
+    """
+    stale = [
+        o for o in objects
+        if o is not None and any(d.isTouched() for d in [o] + o.OutListRecursive)
+    ]
+    if stale:
+        name = _stages[-1] if _stages else _caller(2)
+        _recompute(stale[0].Document, f"{name} (ensure)", stale)
+
+
+@contextlib.contextmanager
+def batch(doc=None, label="Honeycomb"):
+    """
+    Group edits into one undo transaction with a single recompute.
+    Nestable: only the outermost batch turns AutoRecompute off, opens the
+    transaction, freezes the main window (tree and 3D views) and, on exit,
+    restores them, recomputes once and runs any deferred viewFit().
+    An exception aborts the transaction instead of committing it.
+    """
+    doc = doc or App.ActiveDocument
+    state = _batches.get(doc.Name)
+    if state:
+        state[0] += 1
+        try:
+            yield doc
+        finally:
+            state[0] -= 1
+        return
+
+    state = _batches[doc.Name] = [1, getattr(doc, "AutoRecompute", True), False]
+    if hasattr(doc, "AutoRecompute"):
+        doc.AutoRecompute = False
+    doc.openTransaction(label)
+    window = _mainWindow()
+    if window:
+        window.setUpdatesEnabled(False)
+    try:
+        yield doc
+    except BaseException:
+        doc.abortTransaction()
+        raise
+    else:
+        doc.commitTransaction()
+    finally:
+        del _batches[doc.Name]
+        if hasattr(doc, "AutoRecompute"):
+            doc.AutoRecompute = state[1]
+        _recompute(doc, label)
+        if window:
+            window.setUpdatesEnabled(True)
+        if state[2]:
+            viewFit(doc)
+
+
+def _mainWindow():
+    if not App.GuiUp:
+        return None
+    import FreeCADGui as Gui
+
+    return Gui.getMainWindow()
+
+
+def viewFit(doc=None):
+    """Fit the active 3D view, or once the current batch is done."""
+    doc = doc or App.ActiveDocument
+    state = _batches.get(doc.Name) if doc else None
+    if state:
+        state[2] = True
+        return
+    if App.GuiUp:
+        import FreeCADGui as Gui
+
+        Gui.SendMsgToActiveView("ViewFit")
+
+
+def summary():
+    """
+    Per-stage totals, in first-call order: dicts with stage, calls, touched,
+    seconds, budget and overBudget.
+    """
+    stages = {}
+    for record in records:
+        row = stages.setdefault(
+            record.stage,
+            {"stage": record.stage, "calls": 0, "touched": 0, "seconds": 0.0},
+        )
+        row["calls"] += 1
+        row["touched"] += record.touched
+        row["seconds"] += record.seconds
+    for row in stages.values():
+        row["budget"] = budgets.get(row["stage"], BUDGET)
+        row["overBudget"] = row["calls"] > row["budget"]
+    return list(stages.values())
+
+
+def report():
+    """Print the summary to the report view and return the stages over budget."""
+    rows = summary()
+    for row in rows:
+        flag = "  OVER BUDGET" if row["overBudget"] else ""
+        App.Console.PrintMessage(
+            f"{row['stage']:<40} {row['calls']:>3} recomputes ({row['budget']} allowed) "
+            f"{row['touched']:>5} touched {row['seconds'] * 1000:>9.1f} ms{flag}\n"
+        )
+    total = sum(row["seconds"] for row in rows)
+    App.Console.PrintMessage(f"{len(records)} recomputes, {total * 1000:.1f} ms\n")
+    return [row for row in rows if row["overBudget"]]
+
+
+def reset():
+    records.clear()
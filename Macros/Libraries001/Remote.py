@@ -0,0 +1,344 @@
+"""
+JSON-RPC 2.0 over a local socket, one request (or batch array) per line.
+
+    server = Remote.ParameterServer(App.ActiveDocument).start()   # in FreeCAD
+    with Remote.Client() as client:                               # anywhere
+        client.set_params(radius=2.5, separation=0.3)
+        client.regenerate(source="Pad", subname="Face6")
+        client.export("/tmp/plate.step")
+
+Connections are served on background threads, which only queue calls.
+The queue is drained on the GUI thread (a queued Qt signal, see
+guiDispatcher), every call waiting at that moment in one go, so the
+document is never touched from another thread. set_params() only stages
+values; regenerate() writes them to EditMe and rebuilds through the
+memoized pipeline in one batch, which is a single incremental recompute.
+
+FreeCAD and the pipeline are only imported when no pipeline is passed in,
+so the server and Client run against a stand-in document and pipeline.
+"""
+import inspect
+import json
+import os
+import queue
+import socket
+import socketserver
+import threading
+import time
+
+HOST = "127.0.0.1"
+PORT = 8765
+# Seconds a connection waits for the GUI thread to answer one request
+TIMEOUT = 120
+
+# RPC parameter names (EditMe aliases) -> SpreadSheet attributes
+PARAMETERS = {
+    "radius": "hexRadius",
+    "separation": "hexSeparation",
+    "height": "hexExtrusion",
+    "planeOffset": "planeOffset",
+}
+
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+SERVER_ERROR = -32000
+
+
+class RemoteError(Exception):
+    """An error reply, raised by Client.call()."""
+
+    def __init__(self, code, message):
+        super().__init__(f"{message} ({code})")
+        self.code = code
+
+
+def guiDispatcher():
+    """
+    Callable that runs fn() on the GUI thread, through a Qt signal queued
+    from any thread. Must be created on the GUI thread.
+    """
+    from PySide import QtCore
+
+    class Bridge(QtCore.QObject):
+        call = QtCore.Signal(object)
+
+        @QtCore.Slot(object)
+        def run(self, fn):
+            fn()
+
+    # The slot belongs to the bridge, which lives on the GUI thread; queued
+    # explicitly so an emit from a socket thread never runs fn() there
+    bridge = Bridge()
+    bridge.call.connect(bridge.run, QtCore.Qt.QueuedConnection)
+
+    def dispatch(fn):
+        bridge.call.emit(fn)
+
+    return dispatch
+
+
+def _log(message):
+    try:
+        import FreeCAD as App
+    except ImportError:
+        print(message, end="")
+    else:
+        App.Console.PrintMessage(message)
+
+
+def _reply(id, result=None, error=None):
+    if error is not None:
+        return {"jsonrpc": "2.0", "error": {"code": error[0], "message": error[1]}, "id": id}
+    return {"jsonrpc": "2.0", "result": result, "id": id}
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def handle(self):
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            reply = self.server.owner.submit(line)
+            if reply is not None:
+                self.wfile.write(json.dumps(reply).encode() + b"\n")
+                self.wfile.flush()
+
+
+class _TCPServer(socketserver.ThreadingTCPServer):
+    allow_reuse_address = True
+    daemon_threads = True
+
+
+class ParameterServer:
+    """
+    Serve set_params, get_params, regenerate and export for `doc` on
+    host:port (port 0 picks a free one, see self.address). `pipeline` is
+    anything with run(source, subname, **parameters), parameters(),
+    `executed` and `recomputes`,
+    HoneycombPipeline by default; `dispatch(fn)` hands the queue drain to
+    the GUI thread (default: guiDispatcher() with the GUI up, else inline on
+    the connection thread). Drains are serialized by a lock either way, so
+    concurrent clients never run the pipeline on the document at once.
+    """
+
+    def __init__(self, doc=None, host=HOST, port=PORT, pipeline=None, dispatch=None):
+        if doc is None or pipeline is None or dispatch is None:
+            import FreeCAD as App
+
+            doc = doc or App.ActiveDocument
+            if pipeline is None:
+                import Libraries001.Pipelines as Pipelines
+
+                pipeline = Pipelines.HoneycombPipeline(doc)
+            if dispatch is None:
+                dispatch = guiDispatcher() if App.GuiUp else (lambda fn: fn())
+        self.doc = doc
+        self.pipeline = pipeline
+        self.dispatch = dispatch
+        self.lock = threading.Lock()
+        self.parameters = {}
+        self.source = None
+        self.subname = None
+        self.cut = None
+        self.calls = queue.Queue()
+        self.methods = {
+            "set_params": self.setParams,
+            "get_params": self.getParams,
+            "regenerate": self.regenerate,
+            "export": self.export,
+        }
+        self.server = _TCPServer((host, port), _Handler, bind_and_activate=True)
+        self.server.owner = self
+        self.address = self.server.server_address
+        self.thread = None
+
+    def start(self):
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        _log(f"[Remote] Listening on {self.address[0]}:{self.address[1]}\n")
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    # ---- Connection threads
+    def submit(self, line):
+        """Queue one request line for the GUI thread and wait for its reply (None for notifications)."""
+        try:
+            message = json.loads(line)
+        except ValueError as error:
+            return _reply(None, error=(PARSE_ERROR, f"Parse error: {error}"))
+        isBatch = isinstance(message, list)
+        requests = message if isBatch else [message]
+        if not requests:
+            return _reply(None, error=(INVALID_REQUEST, "Empty batch"))
+
+        done = threading.Event()
+        slot = {"requests": requests, "replies": None, "done": done}
+        self.calls.put(slot)
+        self.dispatch(self.drain)
+        if not done.wait(TIMEOUT):
+            return _reply(None, error=(SERVER_ERROR, "Timed out waiting for the FreeCAD GUI thread"))
+        replies = [r for r in slot["replies"] if r is not None]
+        if isBatch:
+            return replies or None
+        return replies[0] if replies else None
+
+    # ---- GUI thread
+    def drain(self):
+        """Answer every queued call, in arrival order, one drain at a time."""
+        with self.lock:
+            while True:
+                try:
+                    slot = self.calls.get_nowait()
+                except queue.Empty:
+                    return
+                slot["replies"] = [self.execute(request) for request in slot["requests"]]
+                slot["done"].set()
+
+    def execute(self, request):
+        if not isinstance(request, dict) or not isinstance(request.get("method"), str):
+            return _reply(None, error=(INVALID_REQUEST, "Invalid request"))
+        id = request.get("id")
+        method = self.methods.get(request["method"])
+        if method is None:
+            error = (METHOD_NOT_FOUND, f"Unknown method: {request['method']}")
+            return None if "id" not in request else _reply(id, error=error)
+        params = request.get("params", {})
+        args, kwargs = ((), params) if isinstance(params, dict) else (params, {})
+        result = error = None
+        try:
+            inspect.signature(method).bind(*args, **kwargs)
+        except TypeError as bindError:
+            error = (INVALID_PARAMS, str(bindError))
+        else:
+            try:
+                result = method(*args, **kwargs)
+            except ValueError as callError:
+                error = (INVALID_PARAMS, str(callError))
+            except Exception as callError:
+                error = (SERVER_ERROR, f"{type(callError).__name__}: {callError}")
+        if "id" not in request:
+            return None
+        return _reply(id, result, error)
+
+    # ---- Methods
+    def setParams(self, **parameters):
+        """Stage parameter values for the next regenerate(); returns the effective values."""
+        unknown = set(parameters) - set(PARAMETERS)
+        if unknown:
+            raise ValueError(f"Unknown parameters: {', '.join(sorted(unknown))}")
+        for name, value in parameters.items():
+            self.parameters[name] = float(value)
+        return self.getParams()
+
+    def getParams(self):
+        """Every parameter as the next regenerate() would use it: staged values over EditMe's."""
+        current = self.pipeline.parameters()
+        values = {name: current[attribute] for name, attribute in PARAMETERS.items()}
+        values.update(self.parameters)
+        return values
+
+    def regenerate(self, source=None, subname=None, strategy="auto"):
+        """
+        Rebuild on `source` (object name) / `subname`, default the previous
+        face, else the GUI selection. Returns the stages run, the recomputes
+        made and the seconds taken.
+        """
+        if source is not None:
+            self.source = self.doc.getObject(source)
+            if self.source is None:
+                raise ValueError(f"No object named {source!r}")
+            self.subname = subname
+        start = time.perf_counter()
+        self.cut = self.pipeline.run(
+            self.source,
+            self.subname,
+            strategy=strategy,
+            **{PARAMETERS[name]: value for name, value in self.parameters.items()},
+        )
+        # Now in EditMe: later hand edits of the sheet win again
+        self.parameters.clear()
+        return {
+            "stages": list(self.pipeline.executed),
+            "recomputes": self.pipeline.recomputes,
+            "seconds": time.perf_counter() - start,
+        }
+
+    def export(self, path):
+        """Save the cut as STEP, BREP or STL, or a copy of the whole document as FCStd."""
+        path = os.path.abspath(os.path.expanduser(path))
+        extension = os.path.splitext(path)[1].lower()
+        if extension == ".fcstd":
+            self.doc.saveCopy(path)
+            return path
+        if self.cut is None:
+            raise ValueError("Nothing to export: call regenerate() first")
+        exporters = {
+            ".step": "exportStep",
+            ".stp": "exportStep",
+            ".brep": "exportBrep",
+            ".brp": "exportBrep",
+            ".stl": "exportStl",
+        }
+        if extension not in exporters:
+            raise ValueError(f"Unsupported export format: {extension or path}")
+        getattr(self.cut.Shape, exporters[extension])(path)
+        return path
+
+
+class Client:
+    """
+    Blocking client: client.call("set_params", radius=2) or client.set_params(radius=2).
+    batch([(method, params), ...]) sends every call in one request array.
+    """
+
+    def __init__(self, host=HOST, port=PORT, timeout=TIMEOUT):
+        self.socket = socket.create_connection((host, port), timeout=timeout)
+        self.stream = self.socket.makefile("rb")
+        self.ids = iter(range(1, 1 << 62))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return lambda *args, **kwargs: self.call(name, *args, **kwargs)
+
+    def close(self):
+        self.stream.close()
+        self.socket.close()
+
+    def _send(self, message):
+        self.socket.sendall(json.dumps(message).encode() + b"\n")
+        line = self.stream.readline()
+        if not line:
+            raise ConnectionError("The parameter server closed the connection")
+        return json.loads(line)
+
+    @staticmethod
+    def _result(reply):
+        if "error" in reply:
+            raise RemoteError(reply["error"]["code"], reply["error"]["message"])
+        return reply["result"]
+
+    def call(self, method, *args, **kwargs):
+        if args and kwargs:
+            raise TypeError("JSON-RPC takes positional or keyword parameters, not both")
+        request = {"jsonrpc": "2.0", "method": method, "params": kwargs or list(args), "id": next(self.ids)}
+        return self._result(self._send(request))
+
+    def batch(self, calls):
+        """Results of [(method, params dict or list), ...], in order; the first error is raised."""
+        requests = [
+            {"jsonrpc": "2.0", "method": method, "params": params, "id": next(self.ids)}
+            for method, params in calls
+        ]
+        replies = {reply["id"]: reply for reply in self._send(requests)}
+        return [self._result(replies[request["id"]]) for request in requests]
@@ -1,5 +1,9 @@
 import FreeCAD as App
-import numpy as np
+
+import Libraries001.Formulas as Formulas
+import Libraries001.Geometry as Geometry
+import Libraries001.Lattices as Lattices
+import Libraries001.Recomputes as Recomputes
 
 hexSeparation = 1
 hexExtrusion = -5
@@ -8,6 +12,92 @@ planeOffset = -6
 userSheetLabel = "EditMe"
 autoGeneratedLabel = "AutoGenerated"
 
+# SpreadSheet attributes -> EditMe aliases
+USER_ALIASES = {
+    "hexRadius": "radius",
+    "hexSeparation": "separation",
+    "hexExtrusion": "height",
+    "planeOffset": "planeOffset",
+}
+
+
+# Declarative sheet layouts: tuples of (cell, contents, alias or None)
+def userLayout(radius, separation, height, offset):
+    """EditMe sheet layout holding the user parameters."""
+    return (
+        ("A1", "User Variables", None),
+        ("A2", "Hexagon Radius:", None),
+        ("B2", str(radius), "radius"),
+        ("A3", "Hexagon Separation:", None),
+        ("B3", str(separation), "separation"),
+        ("A6", "Grid Height:", None),
+        ("B6", str(height), "height"),
+        ("A7", "Plane Offset:", None),
+        ("B7", str(offset), "planeOffset"),
+    )
+
+
+def autoGeneratedLayout(width, length):
+    """AutoGenerated sheet layout for a width x length grid."""
+    return (
+        ("A1", "Auto-Generated Variables", None),
+        ("D1", "Calculated Values", None),
+        ("A2", "Hexagon Radius:", None),
+        ("B2", f"={userSheetLabel}.radius", "radius"),
+        ("A3", "Hexagon Separation:", None),
+        ("B3", f"={userSheetLabel}.separation", "separation"),
+        ("A6", "Grid Height:", None),
+        ("B6", f"={userSheetLabel}.height", "height"),
+        ("B7", "", "planeOffset"),
+        ("A4", "Grid Width:", None),
+        ("B4", str(width), "width"),
+        ("A5", "Grid Length:", None),
+        ("B5", str(length), "length"),
+        ("A8", "Tweak X:", None),
+        ("B8", "0", "tweakX"),
+        ("A9", "Tweak Y:", None),
+        ("B9", "0", "tweakY"),
+        ("A10", "Tweak Z:", None),
+        ("B10", "0", "tweakZ"),
+        ("D2", "X Interval:", None),
+        ("E2", Formulas.FORMULAS["xInterval"][1], "xInterval"),
+        ("D3", "Y Interval:", None),
+        ("E3", Formulas.FORMULAS["yInterval"][1], "yInterval"),
+        ("D4", "First X:", None),
+        ("E4", Formulas.FORMULAS["firstX"][1], "firstX"),
+        ("D5", "First Y:", None),
+        ("E5", Formulas.FORMULAS["firstY"][1], "firstY"),
+        ("D6", "Count X:", None),
+        ("E6", Formulas.FORMULAS["countX"][1], "countX"),
+        ("D7", "Count Y:", None),
+        ("E7", Formulas.FORMULAS["countY"][1], "countY"),
+        ("D8", "Array2 XPos:", None),
+        ("E8", Formulas.FORMULAS["array2XPos"][1], "array2XPos"),
+        ("D9", "Array2 YPos:", None),
+        ("E9", Formulas.FORMULAS["array2YPos"][1], "array2YPos"),
+        ("D10", "Array Count X:", None),
+        ("E10", Formulas.FORMULAS["arrayCountX"][1], "arrayCountX"),
+        ("D11", "Array Count Y:", None),
+        ("E11", Formulas.FORMULAS["arrayCountY"][1], "arrayCountY"),
+    )
+
+
+def sameContents(current, wanted):
+    """
+    True when a cell already holds `wanted`. FreeCAD re-prints formulas,
+    so spacing and the degree sign are ignored and numbers compare by value.
+    """
+    def normalize(text):
+        return "".join(str(text).split()).replace("°", "deg")
+
+    current, wanted = normalize(current), normalize(wanted)
+    if current == wanted:
+        return True
+    try:
+        return float(current) == float(wanted)
+    except ValueError:
+        return False
+
 
 class SpreadSheet:
     def __init__(self):
@@ -19,6 +109,21 @@ class SpreadSheet:
         self.hexagon = None
         self.aliases = {}
 
+    def load(self, doc=None):
+        """
+        Take the parameters from doc's EditMe sheet when it exists, so a later
+        userSpreadSheet() keeps the user's values. Returns them by attribute.
+        """
+        doc = doc or App.ActiveDocument
+        sheet = doc.getObject(userSheetLabel) if doc else None
+        if sheet is not None:
+            Recomputes.ensure(sheet)
+            for attribute, alias in USER_ALIASES.items():
+                value = getattr(sheet, alias, None)
+                if value is not None:
+                    setattr(self, attribute, float(getattr(value, "Value", value)))
+        return {attribute: getattr(self, attribute) for attribute in USER_ALIASES}
+
     def create(self, label: str):
         doc = App.ActiveDocument
         if not doc:
@@ -26,7 +131,8 @@ class SpreadSheet:
         sheet = doc.getObject(label)
         if sheet is None:
             sheet = doc.addObject("Spreadsheet::Sheet", label)
-        sheet.setColumnWidth("A", 150)
+        if sheet.getColumnWidth("A") != 150:
+            sheet.setColumnWidth("A", 150)
         self.set = sheet.set
         self.sheet = sheet
         self.name = label
@@ -36,137 +142,51 @@ class SpreadSheet:
         if not self.sheet:
             raise RuntimeError("Sheet not initialized.")
         for alias_name, cell in aliases.items():
-            self.sheet.setAlias(cell, alias_name)
+            if self.sheet.getAlias(cell) != alias_name:
+                self.sheet.setAlias(cell, alias_name)
         self.aliases = aliases
 
+    def apply(self, layout):
+        """
+        Bring the sheet in line with `layout`, writing only the aliases and
+        cells whose contents differ. An unchanged layout leaves the sheet
+        untouched, so nothing downstream recomputes.
+        Returns the number of cells written.
+        """
+        if not self.sheet:
+            raise RuntimeError("Sheet not initialized.")
+        self.aliase({alias: cell for cell, _, alias in layout if alias})
+        current = {cell: self.sheet.getContents(cell) for cell, _, _ in layout}
+        written = 0
+        for cell, contents, _ in layout:
+            if contents and not sameContents(current[cell], contents):
+                self.sheet.set(cell, contents)
+                written += 1
+        return written
+
     def userSpreadSheet(self):
         doc = App.ActiveDocument
-        had_autorc = getattr(doc, "AutoRecompute", True)
-        if hasattr(doc, "AutoRecompute"):
-            doc.AutoRecompute = False
-        try:
+        with Recomputes.batch(doc, "User spreadsheet"):
             sheet = self.create(userSheetLabel)
-            setc = self.set
-
-            aliases = {
-                "radius": "B2",
-                "separation": "B3",
-                "height": "B6",
-                "planeOffset": "B7",
-            }
-            self.aliase(aliases)
-
-            setc("A1", "User Variables")
-            setc("A2", "Hexagon Radius:")
-            setc(aliases["radius"], str(self.hexRadius))
-            setc("A3", "Hexagon Separation:")
-            setc(aliases["separation"], str(self.hexSeparation))
-            setc("A6", "Grid Height:")
-            setc(aliases["height"], str(self.hexExtrusion))
-            setc("A7", "Plane Offset:")
-            setc(aliases["planeOffset"], str(planeOffset))
-        finally:
-            if hasattr(doc, "AutoRecompute"):
-                doc.AutoRecompute = had_autorc
-        doc.recompute()
+            self.apply(
+                userLayout(self.hexRadius, self.hexSeparation, self.hexExtrusion, self.planeOffset)
+            )
         return sheet
 
     def orientedBoundBox(self, offset2D):
-        pts = np.array([[v.X, v.Y, v.Z] for v in offset2D.Shape.Vertexes])
-
-        face = offset2D.Shape.Faces[0]
-        normal = face.normalAt(0, 0)
-
-        u = normal.cross(App.Vector(0, 0, 1))
-        if u.Length == 0:
-            u = App.Vector(1, 0, 0)
-        v = normal.cross(u)
-        u.normalize()
-        v.normalize()
-
-        coords2D = [(p.dot(u), p.dot(v)) for p in map(App.Vector, pts)]
-
-        xs = [c[0] for c in coords2D]
-        ys = [c[1] for c in coords2D]
-        width = max(xs) - min(xs)
-        height = max(ys) - min(ys)
+        arrays = Geometry.shapeArrays(offset2D)
+        frame = Lattices.planeFrame(arrays.faceNormals[0])
+        coords2D = Lattices.toPlane(arrays.vertices, frame)
+        width, height = coords2D.max(axis=0) - coords2D.min(axis=0)
         return max(width, height)
 
     def compute(self, offset2D):
         doc = App.ActiveDocument
-        had_autorc = getattr(doc, "AutoRecompute", True)
-        if hasattr(doc, "AutoRecompute"):
-            doc.AutoRecompute = False
-        try:
+        with Recomputes.batch(doc, "Auto-generated spreadsheet"):
             sheet = self.create(autoGeneratedLabel)
-            setc = self.set
-
-            aliases = {
-                "radius": "B2",
-                "separation": "B3",
-                "height": "B6",
-                "planeOffset": "B7",
-                "width": "B4",
-                "length": "B5",
-                "tweakX": "B8",
-                "tweakY": "B9",
-                "tweakZ": "B10",
-                "xInterval": "E2",
-                "yInterval": "E3",
-                "firstX": "E4",
-                "firstY": "E5",
-                "countX": "E6",
-                "countY": "E7",
-                "array2XPos": "E8",
-                "array2YPos": "E9",
-            }
-            self.aliase(aliases)
-
-            setc("A1", "Auto-Generated Variables")
-            setc("D1", "Calculated Values")
-            setc("A2", "Hexagon Radius:")
-            setc(aliases["radius"], f"={userSheetLabel}.radius")
-            setc("A3", "Hexagon Separation:")
-            setc(aliases["separation"], f"={userSheetLabel}.separation")
-            setc("A6", "Grid Height:")
-            setc(aliases["height"], f"={userSheetLabel}.height")
-            
-            
-
             width = self.orientedBoundBox(offset2D)
             length = width
-
-            setc("A4", "Grid Width:")
-            setc(aliases["width"], str(width))
-            setc("A5", "Grid Length:")
-            setc(aliases["length"], str(length))
-            setc("A8", "Tweak X:")
-            setc(aliases["tweakX"], "0")
-            setc("A9", "Tweak Y:")
-            setc(aliases["tweakY"], "0")
-            setc("A10", "Tweak Z:")
-            setc(aliases["tweakZ"], "0")
-
-            setc("D2", "X Interval:")
-            setc(aliases["xInterval"], "=2*sin(60 deg)*(B2*2 + (B3 - 0.267949*B2))")
-            setc("D3", "Y Interval:")
-            setc(aliases["yInterval"], "=2*B2 + (B3 - 0.267949*B2)")
-            setc("D4", "First X:")
-            setc(aliases["firstX"], "0")
-            setc("D5", "First Y:")
-            setc(aliases["firstY"], "0")
-            setc("D6", "Count X:")
-            setc(aliases["countX"], "=round(B5 / E2) + 2")
-            setc("D7", "Count Y:")
-            setc(aliases["countY"], "=round(B4 / E3) + 2")
-            setc("D8", "Array2 XPos:")
-            setc(aliases["array2XPos"], "=sin(60 deg)*(B2*2 + B3 - 0.267949*B2)")
-            setc("D9", "Array2 YPos:")
-            setc(aliases["array2YPos"], "=E3/2")
-        finally:
-            if hasattr(doc, "AutoRecompute"):
-                doc.AutoRecompute = had_autorc
-        doc.recompute()
+            self.apply(autoGeneratedLayout(width, length))
         return sheet
 
     def write(self):
@@ -174,5 +194,5 @@ class SpreadSheet:
             raise RuntimeError(
                 "No sheet to write to. Call userSpreadSheet() or compute() first."
             )
-        App.ActiveDocument.recompute()
+        Recomputes.recompute(App.ActiveDocument)
         return self.sheet
@@ -0,0 +1,144 @@
+import math
+
+import FreeCAD as App
+import numpy as np
+
+import Libraries001.Geometry as Geometry
+
+# Grid resolution used to tabulate freeform surfaces
+SAMPLES = 64
+
+
+class SurfaceMap:
+    """
+    Maps flat lattice coordinates onto a (possibly curved) face.
+
+    Lattice coordinates (s, t) are the face's (u, v) parameters scaled to
+    millimetres, so a lattice laid out in (s, t) keeps roughly its size on
+    the surface. Planes and cylinders are mapped exactly; any other surface
+    is tabulated once on a samples x samples grid and interpolated, so mapping
+    every cell vertex is a single batched NumPy evaluation.
+    """
+
+    def __init__(self, face, samples=SAMPLES):
+        self.face = face
+        self.samples = samples
+        self.u0, self.u1, self.v0, self.v1 = face.ParameterRange
+        self.kind = face.Surface.TypeId
+        if self.kind == "Part::GeomCylinder":
+            self._cylinder()
+        else:
+            self._grid()
+
+    def _evaluate(self, u, v):
+        point = self.face.valueAt(u, v)
+        normal = self.face.normalAt(u, v)
+        return (point.x, point.y, point.z), (normal.x, normal.y, normal.z)
+
+    def _cylinder(self):
+        surface = self.face.Surface
+        self.center = np.array([surface.Center.x, surface.Center.y, surface.Center.z])
+        self.axis = np.array([surface.Axis.x, surface.Axis.y, surface.Axis.z])
+        self.radius = surface.Radius
+
+        # Recover the u = 0 direction and the sense of u from the surface itself
+        start = np.array(self._evaluate(0.0, 0.0)[0]) - self.center
+        self.e1 = start - (start @ self.axis) * self.axis
+        self.e1 /= np.linalg.norm(self.e1)
+        self.e2 = np.cross(self.axis, self.e1)
+        quarter = np.array(self._evaluate(math.pi / 2, 0.0)[0]) - self.center
+        if quarter @ self.e2 < 0:
+            self.e2 = -self.e2
+        self.base = self.center + (start @ self.axis) * self.axis
+        self.sense = 1.0 if np.array(self._evaluate(0.0, 0.0)[1]) @ self.e1 > 0 else -1.0
+        self.scaleU = self.radius
+        self.scaleV = 1.0
+
+    def _grid(self):
+        u = np.linspace(self.u0, self.u1, self.samples)
+        v = np.linspace(self.v0, self.v1, self.samples)
+        values = [self._evaluate(a, b) for a in u for b in v]
+        shape = (self.samples, self.samples, 3)
+        self.points = np.array([p for p, _ in values]).reshape(shape)
+        self.normals = np.array([n for _, n in values]).reshape(shape)
+
+        # Mean arc length per unit parameter along each direction
+        du = np.linalg.norm(np.diff(self.points, axis=0), axis=2).sum(axis=0).mean()
+        dv = np.linalg.norm(np.diff(self.points, axis=1), axis=2).sum(axis=1).mean()
+        self.scaleU = du / max(self.u1 - self.u0, 1e-12)
+        self.scaleV = dv / max(self.v1 - self.v0, 1e-12)
+
+    def toParameters(self, st):
+        """(..., 2) lattice coordinates to (..., 2) face parameters."""
+        st = np.asarray(st, dtype=float)
+        return np.stack(
+            [self.u0 + st[..., 0] / self.scaleU, self.v0 + st[..., 1] / self.scaleV], axis=-1
+        )
+
+    def bounds(self):
+        """Lattice-coordinate rectangle covering the whole parameter range."""
+        return (0.0, 0.0, (self.u1 - self.u0) * self.scaleU, (self.v1 - self.v0) * self.scaleV)
+
+    def map(self, st):
+        """
+        Surface points and unit normals (..., 3) for (..., 2) lattice coordinates.
+        Normals follow the face orientation (face.normalAt).
+        """
+        uv = self.toParameters(st)
+        if self.kind == "Part::GeomCylinder":
+            radial = np.cos(uv[..., 0, None]) * self.e1 + np.sin(uv[..., 0, None]) * self.e2
+            points = self.base + uv[..., 1, None] * self.axis + self.radius * radial
+            return points, self.sense * radial
+        return self._interpolate(self.points, uv), _normalize(self._interpolate(self.normals, uv))
+
+    def _interpolate(self, table, uv):
+        last = self.samples - 1
+        x = np.clip((uv[..., 0] - self.u0) / max(self.u1 - self.u0, 1e-12) * last, 0, last)
+        y = np.clip((uv[..., 1] - self.v0) / max(self.v1 - self.v0, 1e-12) * last, 0, last)
+        x0 = np.minimum(np.floor(x).astype(np.int64), last - 1)
+        y0 = np.minimum(np.floor(y).astype(np.int64), last - 1)
+        tx, ty = (x - x0)[..., None], (y - y0)[..., None]
+        bottom = table[x0, y0] * (1 - ty) + table[x0, y0 + 1] * ty
+        top = table[x0 + 1, y0] * (1 - ty) + table[x0 + 1, y0 + 1] * ty
+        return bottom * (1 - tx) + top * tx
+
+    def rings(self, deflection=0.1):
+        """
+        Face boundary in lattice coordinates: outer wire first, then holes.
+        Periodic parameters are unwrapped along each loop, so a closed
+        cylinder's seam becomes the two sides of a rectangle.
+        """
+        surface = self.face.Surface
+        rings = []
+        for loop in Geometry.faceLoops(self.face, deflection):
+            uv = np.array([surface.parameter(App.Vector(*p)) for p in loop])
+            if surface.isUPeriodic():
+                uv[:, 0] = np.unwrap(uv[:, 0], period=surface.UPeriod())
+                uv[:, 0] += math.floor((self.u0 - uv[:, 0].min()) / surface.UPeriod() + 0.5) * surface.UPeriod()
+            if surface.isVPeriodic():
+                uv[:, 1] = np.unwrap(uv[:, 1], period=surface.VPeriod())
+                uv[:, 1] += math.floor((self.v0 - uv[:, 1].min()) / surface.VPeriod() + 0.5) * surface.VPeriod()
+            rings.append(np.column_stack([(uv[:, 0] - self.u0) * self.scaleU, (uv[:, 1] - self.v0) * self.scaleV]))
+        return rings
+
+
+def _normalize(vectors):
+    return vectors / np.maximum(np.linalg.norm(vectors, axis=-1, keepdims=True), 1e-12)
+
+
+def tangentCells(surfaceMap, centers, cells, height):
+    """
+    Flatten each mapped cell onto the tangent plane at its center.
+    Returns (bases (N, K, 3), directions (N, 3)): every base sits on the
+    far side of the surface from the extrusion by the cell's sag, and
+    direction extrudes it `height` past the surface along the local normal.
+    """
+    origin, normal = surfaceMap.map(centers)
+    points, _ = surfaceMap.map(cells)
+    offset = np.einsum("nki,ni->nk", points - origin[:, None, :], normal)
+    flat = points - offset[..., None] * normal[:, None, :]
+    sag = np.abs(offset).max(axis=1)
+    sign = 1.0 if height >= 0 else -1.0
+    bases = flat - (sign * sag)[:, None, None] * normal[:, None, :]
+    directions = normal * (height + sign * sag)[:, None]
+    return bases, directions
@@ -0,0 +1,131 @@
+import csv
+import itertools
+import os
+import shutil
+import tempfile
+import time
+
+import FreeCAD as App
+
+import Libraries001.Booleans as Booleans
+import Libraries001.Clipping as Clipping
+import Libraries001.Patterns as Patterns
+import Libraries001.Planes as Planes
+import Libraries001.Recomputes as Recomputes
+import Libraries001.Spreadsheets as Spreadsheets
+
+# Parameters a sweep may vary, mapped to SpreadSheet attributes
+PARAMETERS = {
+    "hexRadius": "hexRadius",
+    "hexSeparation": "hexSeparation",
+    "hexExtrusion": "hexExtrusion",
+    "planeOffset": "planeOffset",
+}
+# g/cm^3 (PLA), used for the reported mass
+DENSITY = 1.24
+
+_worker = {}
+
+
+def grid(**axes):
+    """Every combination of the given parameter lists, as a list of dicts."""
+    unknown = set(axes) - set(PARAMETERS)
+    if unknown:
+        raise ValueError(f"Unknown sweep parameters: {', '.join(sorted(unknown))}")
+    names = list(axes)
+    return [dict(zip(names, values)) for values in itertools.product(*(axes[n] for n in names))]
+
+
+def _open(path, folder, objectName, subname):
+    """Worker initializer: open a private copy of the document."""
+    copy = os.path.join(folder, f"{os.getpid()}-{os.path.basename(path)}")
+    shutil.copyfile(path, copy)
+    doc = App.openDocument(copy, hidden=True)
+    App.setActiveDocument(doc.Name)
+    _worker.update(doc=doc, objectName=objectName, subname=subname)
+
+
+def build(doc, objectName, subname, parameters, density=DENSITY, strategy="auto", mode="direct"):
+    """
+    Run the honeycomb pipeline once on doc's `objectName` / `subname` face
+    with `parameters` and measure the result. `mode` "uv" lays the lattice
+    out on the (possibly curved) face itself, see Pipelines.MODES.
+    Returns a result dict: removedVolume is the uncut plate less the cut,
+    mass that of `objectName` with the removed volume taken out.
+    """
+    source = doc.getObject(objectName)
+    start = time.perf_counter()
+    with Recomputes.batch(doc, "Sweep"):
+        sheet = Spreadsheets.SpreadSheet()
+        for name, value in parameters.items():
+            setattr(sheet, PARAMETERS[name], value)
+        userSheet = sheet.userSpreadSheet()
+
+        plane = Planes.Plane()
+        binder = plane.createShapeBinder(source, subname)
+        offset2D = binder if mode == "uv" else plane.createOffset2D(binder)
+        autoSheet = sheet.compute(offset2D=offset2D)
+
+        pattern = Patterns.HexagonalPattern(userSheet, autoSheet, offset2D, "hexagons")
+        if mode == "uv":
+            pattern.latticeMapped()
+        else:
+            pattern.classify()
+        labels = pattern.labels
+        cut = pattern.cut(strategy=strategy)
+    seconds = time.perf_counter() - start
+
+    Recomputes.ensure(source)
+    removed = pattern.blankVolume(float(userSheet.height)) - cut.Shape.Volume
+    return {
+        **parameters,
+        "cells": int((labels != Clipping.OUTSIDE).sum()),
+        "strategy": pattern.strategy,
+        "removedVolume": removed,
+        "mass": (source.Shape.Volume - removed) * density * 1e-3,
+        "seconds": seconds,
+    }
+
+
+def _run(job):
+    """Worker: build one combination, then drop every object it added."""
+    parameters, density = job
+    doc = _worker["doc"]
+    before = {o.Name for o in doc.Objects}
+    try:
+        # The pool already fills every core: keep each cut to a single boolean
+        return build(doc, _worker["objectName"], _worker["subname"], parameters, density, "compound")
+    except Exception as error:
+        return {**parameters, "error": str(error)}
+    finally:
+        for name in [o.Name for o in doc.Objects if o.Name not in before]:
+            if doc.getObject(name):
+                doc.removeObject(name)
+        Recomputes.recompute(doc)
+
+
+def sweep(path, objectName, subname, combinations, workers=None, output="sweep.csv", density=DENSITY):
+    """
+    Build every parameter combination (see grid()) on `path`'s face
+    `objectName` / `subname` across a process pool, one private document
+    copy per worker. Rows (parameters, cells, removedVolume in mm^3, mass of
+    the finished part in g, seconds) are written to `output` and returned, in input order.
+    """
+    workers = workers or os.cpu_count() or 1
+    folder = tempfile.mkdtemp(prefix="honeycomb-sweep-")
+    try:
+        with Booleans.processPool(
+            min(workers, len(combinations)) or 1,
+            _open,
+            (os.path.abspath(path), folder, objectName, subname),
+        ) as pool:
+            rows = list(pool.map(_run, [(c, density) for c in combinations]))
+    finally:
+        shutil.rmtree(folder, ignore_errors=True)
+
+    fields = list(dict.fromkeys(k for row in rows for k in row))
+    with open(output, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=fields)
+        writer.writeheader()
+        writer.writerows(rows)
+    return rows
@@ -0,0 +1,118 @@
+import itertools
+import math
+
+import numpy as np
+
+import Libraries001.Clipping as Clipping
+import Libraries001.Lattices as Lattices
+
+# Far-away points that close every real cell, as a multiple of the bounds size
+SENTINEL_SCALE = 4.0
+SENTINEL_COUNT = 32
+
+
+def ringsArea(rings):
+    """Area enclosed by the outer ring minus its holes."""
+    areas = [abs(float(Clipping.cellAreas(np.asarray(r, dtype=float)[None])[0])) for r in rings]
+    return areas[0] - sum(areas[1:])
+
+
+def sampleSeeds(rings, count, rng):
+    """`count` uniformly distributed seeds inside the rings (rejection sampled in batches)."""
+    outer = np.asarray(rings[0], dtype=float)
+    low, high = outer.min(axis=0), outer.max(axis=0)
+    fill = ringsArea(rings) / max(np.prod(high - low), 1e-300)
+
+    seeds = np.empty((0, 2))
+    while len(seeds) < count:
+        batch = int((count - len(seeds)) / max(fill, 1e-3) * 1.2) + 16
+        candidates = rng.uniform(low, high, size=(batch, 2))
+        seeds = np.vstack([seeds, candidates[Clipping.pointsInRings(candidates, rings)]])
+    return seeds[:count]
+
+
+def voronoiCells(seeds, bounds):
+    """
+    Voronoi cell of every seed, clipped to `bounds` = (xMin, yMin, xMax, yMax).
+    Returns counter-clockwise padded (N, K, 2) cells.
+    """
+    from scipy.spatial import Voronoi
+
+    xMin, yMin, xMax, yMax = bounds
+    middle = np.array([(xMin + xMax) / 2, (yMin + yMax) / 2])
+    reach = SENTINEL_SCALE * max(xMax - xMin, yMax - yMin, 1e-9)
+    angles = np.linspace(0, 2 * math.pi, SENTINEL_COUNT, endpoint=False)
+    sentinels = middle + reach * np.column_stack([np.cos(angles), np.sin(angles)])
+
+    diagram = Voronoi(np.vstack([seeds, sentinels]))
+    regions = [diagram.regions[r] for r in diagram.point_region[: len(seeds)]]
+    counts = np.fromiter(map(len, regions), dtype=np.int64, count=len(regions))
+    flat = np.fromiter(itertools.chain.from_iterable(regions), dtype=np.int64, count=counts.sum())
+    index = np.zeros((len(seeds), counts.max()), dtype=np.int64)
+    index[np.repeat(np.arange(len(seeds)), counts), np.arange(len(flat)) - np.repeat(np.cumsum(counts) - counts, counts)] = flat
+    polygons = Clipping.padCells(diagram.vertices[index], counts)
+
+    # Order each cell counter-clockwise around its seed
+    angle = np.arctan2(polygons[..., 1] - seeds[:, 1, None], polygons[..., 0] - seeds[:, 0, None])
+    angle[np.arange(polygons.shape[1])[None, :] >= counts[:, None]] = np.inf
+    polygons = np.take_along_axis(polygons, np.argsort(angle, axis=1)[..., None], axis=1)
+
+    # Clip the few cells that leave the bounds against its four sides
+    outside = (
+        (polygons[..., 0] < xMin) | (polygons[..., 0] > xMax)
+        | (polygons[..., 1] < yMin) | (polygons[..., 1] > yMax)
+    ).any(axis=1)
+    if outside.any():
+        clipped, clippedCounts = polygons[outside], counts[outside]
+        for normal, offset in (((1, 0), xMin), ((-1, 0), -xMax), ((0, 1), yMin), ((0, -1), -yMax)):
+            clipped, clippedCounts = Clipping.clipHalfPlane(
+                clipped,
+                clippedCounts,
+                np.broadcast_to(np.array(normal, dtype=float), (len(clipped), 2)),
+                np.full(len(clipped), float(offset)),
+            )
+        width = max(polygons.shape[1], clipped.shape[1])
+        polygons = Clipping.padCells(np.pad(polygons, ((0, 0), (0, width - polygons.shape[1]), (0, 0))), counts)
+        polygons[outside] = Clipping.padCells(np.pad(clipped, ((0, 0), (0, width - clipped.shape[1]), (0, 0))), clippedCounts)
+        counts = counts.copy()
+        counts[outside] = clippedCounts
+    return Clipping.padCells(polygons, counts)
+
+
+def relax(seeds, rings, bounds, iterations):
+    """Lloyd relaxation: move each seed to its cell centroid, keeping seeds inside the rings."""
+    for _ in range(iterations):
+        moved = Clipping.cellCentroids(voronoiCells(seeds, bounds))
+        inside = Clipping.pointsInRings(moved, rings)
+        seeds = np.where(inside[:, None], moved, seeds)
+    return seeds
+
+
+def voronoiLattice(radius, separation, rings, iterations=2, seed=0):
+    """
+    Voronoi infill of the region bounded by `rings`.
+    Seed density gives cells about the area of a `radius` hexagon, Lloyd
+    relaxation evens them out, and each cell is inset by separation / 2 so
+    neighbouring cells are `separation` apart.
+    Returns (centers (N, 2), cells (N, K, 2)), same layout as hexLattice.
+    """
+    rng = np.random.default_rng(seed)
+    cellArea = 1.5 * math.sqrt(3) * radius ** 2
+    count = max(1, round(ringsArea(rings) / cellArea))
+
+    outer = np.asarray(rings[0], dtype=float)
+    bounds = (*(outer.min(axis=0) - radius), *(outer.max(axis=0) + radius))
+
+    seeds = relax(sampleSeeds(rings, count, rng), rings, bounds, iterations)
+    cells, kept = Clipping.insetCells(voronoiCells(seeds, bounds), separation / 2)
+    cells = cells[kept]
+    return Clipping.cellCentroids(cells), cells
+
+
+@Lattices.register("voronoi")
+def voronoiGenerator(radius, separation, bounds, rings=None, iterations=2, seed=0, **options):
+    """Registry entry: Voronoi cells inside `rings` (or the `bounds` rectangle)."""
+    if rings is None:
+        xMin, yMin, xMax, yMax = bounds
+        rings = [np.array([[xMin, yMin], [xMax, yMin], [xMax, yMax], [xMin, yMax]])]
+    return voronoiLattice(radius, separation, rings, iterations=iterations, seed=seed)
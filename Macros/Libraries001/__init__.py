@@ -0,0 +1,167 @@
+"""
+Honeycomb macro libraries.
+
+Submodules load on first use (Libraries001.Lattices works without an
+explicit import) and heavy optional dependencies (scipy, Draft) are only
+imported inside the functions that need them. Every submodule's import
+time is recorded in importTimes; importReport() checks the total against
+IMPORT_BUDGET. reloadChanged() re-executes only the submodules whose
+source changed since they were loaded, plus the submodules that use them.
+"""
+import hashlib
+import importlib
+import importlib.abc
+import importlib.machinery
+import sys
+import time
+import types
+
+# Seconds a macro may spend importing these libraries
+IMPORT_BUDGET = 0.5
+
+MODULES = (
+    "Booleans",
+    "Caches",
+    "Clipping",
+    "Folders",
+    "Fingerprints",
+    "Formulas",
+    "Geometry",
+    "Grading",
+    "Lattices",
+    "Patterns",
+    "Pipelines",
+    "Planes",
+    "Prisms",
+    "Recomputes",
+    "Remote",
+    "Spreadsheets",
+    "Surfaces",
+    "Sweeps",
+    "Voronoi",
+)
+
+# Import time per submodule (seconds, including what it imports)
+importTimes = {}
+_hashes = {}
+_depth = [0]
+
+
+class _TimedLoader:
+    """Wraps a submodule's loader to time exec_module()."""
+
+    def __init__(self, loader):
+        self.loader = loader
+
+    def __getattr__(self, name):
+        return getattr(self.loader, name)
+
+    def create_module(self, spec):
+        return self.loader.create_module(spec)
+
+    def exec_module(self, module):
+        _depth[0] += 1
+        start = time.perf_counter()
+        try:
+            self.loader.exec_module(module)
+        finally:
+            _depth[0] -= 1
+            name = module.__name__.rsplit(".", 1)[-1]
+            importTimes[name] = (time.perf_counter() - start, _depth[0] == 0)
+            _hashes[name] = _digest(module)
+
+
+class _TimedFinder(importlib.abc.MetaPathFinder):
+    def find_spec(self, name, path, target=None):
+        if not name.startswith(__name__ + "."):
+            return None
+        spec = importlib.machinery.PathFinder.find_spec(name, path)
+        if spec is not None and spec.loader is not None:
+            spec.loader = _TimedLoader(spec.loader)
+        return spec
+
+
+if not any(type(f).__name__ == "_TimedFinder" for f in sys.meta_path):
+    sys.meta_path.insert(0, _TimedFinder())
+
+
+def __getattr__(name):
+    if name in MODULES:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def importReport(budget=None):
+    """
+    Print each submodule's import time and warn when the top-level imports
+    together exceed `budget` (default IMPORT_BUDGET). Returns that total.
+    """
+    import FreeCAD as App
+
+    budget = IMPORT_BUDGET if budget is None else budget
+    total = sum(seconds for seconds, topLevel in importTimes.values() if topLevel)
+    for name, (seconds, _) in sorted(importTimes.items(), key=lambda item: -item[1][0]):
+        App.Console.PrintLog(f"{name:<14} {seconds * 1000:8.1f} ms\n")
+    if total > budget:
+        App.Console.PrintWarning(
+            f"Libraries001 imports took {total:.2f} s (budget {budget:.2f} s)\n"
+        )
+    return total
+
+
+def _digest(module):
+    with open(module.__file__, "rb") as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+
+def _uses(module):
+    """Names of the sibling submodules `module` imported."""
+    return {
+        value.__name__.rsplit(".", 1)[-1]
+        for value in vars(module).values()
+        if isinstance(value, types.ModuleType) and value.__name__.startswith(__name__ + ".")
+    }
+
+
+def reloadChanged():
+    """
+    Reload the loaded submodules whose source changed since they were
+    imported or last reloaded, then every loaded submodule that uses one of
+    them, dependencies first. Returns the reloaded names.
+    """
+    loaded = {
+        name: sys.modules[f"{__name__}.{name}"]
+        for name in MODULES
+        if f"{__name__}.{name}" in sys.modules
+    }
+    changed = set()
+    for name, module in loaded.items():
+        digest = _digest(module)
+        if _hashes.setdefault(name, digest) != digest:
+            changed.add(name)
+
+    uses = {name: _uses(module) & set(loaded) for name, module in loaded.items()}
+    stale = set(changed)
+    while True:
+        more = {name for name in loaded if name not in stale and uses[name] & stale}
+        if not more:
+            break
+        stale |= more
+
+    order = []
+    seen = set()
+
+    def visit(name):
+        if name in seen:
+            return
+        seen.add(name)
+        for dependency in sorted(uses[name] & stale):
+            visit(dependency)
+        order.append(name)
+
+    for name in sorted(stale):
+        visit(name)
+    for name in order:
+        importlib.reload(loaded[name])
+        _hashes[name] = _digest(loaded[name])
+    return order
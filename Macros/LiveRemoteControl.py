@@ -1,27 +1,158 @@
+"""
+Re-run a script in FreeCAD every time it is saved.
+
+Run this macro once; it returns immediately. A watcher thread waits for
+saves of WATCHED_SCRIPT (inotify on Linux, stat polling elsewhere) and
+signals the GUI thread, where a debounce timer runs the script once the
+saves settle. The script always executes on the GUI thread, in a fresh
+namespace, from a code object cached by content hash.
+
+Set the path with the LIVE_REMOTE_SCRIPT environment variable or
+start(path). With consume=True the file is deleted after each run, for
+tools that push one-off scripts.
+"""
+import ctypes
+import ctypes.util
+import hashlib
 import os
+import select
+import struct
 import threading
 import time
 import traceback
 
-WATCHED_SCRIPT = "/home/leandropaolo1/Documents/VSCODE/Parametric-Modeling/FreecadSeries/Macros/HoneyComb001.py"
+import FreeCAD as App
+from PySide import QtCore
+
+WATCHED_SCRIPT = os.environ.get(
+    "LIVE_REMOTE_SCRIPT",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "remote_script.py"),
+)
+# Saves closer together than this are run once
+DEBOUNCE_MS = 30
+# Stat interval when inotify is not available
+POLL_INTERVAL = 0.05
+
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+
+_codeCache = {}
+
+
+class _Bridge(QtCore.QObject):
+    """Lives on the GUI thread; the watcher thread only emits `saved`."""
+
+    saved = QtCore.Signal(float)
+
+
+class LiveRemoteControl:
+    def __init__(self, path=WATCHED_SCRIPT, consume=False):
+        self.path = os.path.abspath(path)
+        self.consume = consume
+        self.stopped = threading.Event()
+        self.savedAt = None
+
+        self.bridge = _Bridge()
+        self.timer = QtCore.QTimer(self.bridge)
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self.run)
+        # Emitted from the watcher thread, delivered on the GUI thread
+        self.bridge.saved.connect(self.debounce)
+        self.thread = threading.Thread(target=self.watch, daemon=True)
 
+    def start(self):
+        self.thread.start()
+        App.Console.PrintMessage(f"[LiveRemoteControl] Watching {self.path}\n")
+        if os.path.exists(self.path):
+            self.bridge.saved.emit(time.perf_counter())
+        return self
 
-def geometry_push_worker():
-    print("🔁 [GeometryPush] Watching:", WATCHED_SCRIPT)
-    while True:
+    def stop(self):
+        self.stopped.set()
+        self.timer.stop()
+
+    def debounce(self, savedAt):
+        if self.savedAt is None:
+            self.savedAt = savedAt
+        self.timer.start(DEBOUNCE_MS)
+
+    def run(self):
+        """Execute the script on the GUI thread."""
+        savedAt, self.savedAt = self.savedAt, None
+        try:
+            with open(self.path, "rb") as f:
+                source = f.read()
+        except FileNotFoundError:
+            return
+        digest = hashlib.sha1(source).hexdigest()
+        code = _codeCache.get(digest)
         try:
-            if os.path.exists(WATCHED_SCRIPT):
-                with open(WATCHED_SCRIPT, "r") as f:
-                    code = f.read()
-                print("🚀 [GeometryPush] Executing remote_script.py...")
-                exec(code, globals())
-                os.remove(WATCHED_SCRIPT)
+            if code is None:
+                code = _codeCache[digest] = compile(source, self.path, "exec")
+            exec(code, {"__name__": "__main__", "__file__": self.path})
         except Exception:
-            print("❌ [GeometryPush] Error:\n", traceback.format_exc())
-        time.sleep(1)
+            App.Console.PrintError(f"[LiveRemoteControl] Error:\n{traceback.format_exc()}")
+        else:
+            elapsed = (time.perf_counter() - savedAt) * 1000 if savedAt else 0.0
+            App.Console.PrintMessage(
+                f"[LiveRemoteControl] Ran {os.path.basename(self.path)} {elapsed:.0f} ms after save\n"
+            )
+        if self.consume and os.path.exists(self.path):
+            os.remove(self.path)
+
+    def watch(self):
+        try:
+            self.watchInotify()
+        except OSError:
+            self.watchPolling()
+
+    def watchInotify(self):
+        """Block on inotify events for the script's folder (editors often save by rename)."""
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        if not hasattr(libc, "inotify_init1"):
+            raise OSError("inotify is not available")
+        fd = libc.inotify_init1(os.O_CLOEXEC)
+        if fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        try:
+            folder = os.path.dirname(self.path).encode()
+            if libc.inotify_add_watch(fd, folder, IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE) < 0:
+                raise OSError(ctypes.get_errno(), "inotify_add_watch failed")
+            name = os.path.basename(self.path).encode()
+            while not self.stopped.is_set():
+                ready, _, _ = select.select([fd], [], [], 0.5)
+                if not ready:
+                    continue
+                data = os.read(fd, 65536)
+                offset = 0
+                while offset < len(data):
+                    _, _, _, length = struct.unpack_from("iIII", data, offset)
+                    eventName = data[offset + 16:offset + 16 + length].rstrip(b"\0")
+                    offset += 16 + length
+                    if eventName == name:
+                        self.bridge.saved.emit(time.perf_counter())
+        finally:
+            os.close(fd)
+
+    def watchPolling(self):
+        last = None
+        while not self.stopped.is_set():
+            try:
+                stat = os.stat(self.path)
+                current = (stat.st_mtime_ns, stat.st_size)
+            except FileNotFoundError:
+                current = None
+            if current is not None and current != last:
+                self.bridge.saved.emit(time.perf_counter())
+            last = current
+            time.sleep(POLL_INTERVAL)
+
+
+def start(path=WATCHED_SCRIPT, consume=False):
+    """Start watching `path`; returns the LiveRemoteControl (call stop() to end it)."""
+    return LiveRemoteControl(path, consume).start()
 
 
-# Run watcher in a separate thread so it doesn't block FreeCAD GUI
-thread = threading.Thread(target=geometry_push_worker, daemon=True)
-thread.start()
-print("✅ [GeometryPush] Running in background.")
+if __name__ == "__main__":
+    liveRemoteControl = start()
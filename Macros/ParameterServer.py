@@ -0,0 +1,28 @@
+"""
+Serve the honeycomb parameters of the active document over local JSON-RPC.
+
+Run this macro once; it returns immediately. Then, from any Python:
+
+    import Libraries001.Remote as Remote
+    with Remote.Client() as client:
+        client.set_params(radius=2.5, separation=0.3)
+        client.regenerate(source="Pad", subname="Face6")
+
+See Libraries001/Remote.py for the methods. Set PARAMETER_SERVER_PORT to
+listen elsewhere than Remote.PORT; call parameterServer.stop() to close it.
+"""
+import os
+import sys
+
+import FreeCAD as App
+
+MACROS = os.path.dirname(os.path.abspath(__file__))
+if MACROS not in sys.path:
+    sys.path.append(MACROS)
+
+import Libraries001.Remote as Remote
+
+if __name__ == "__main__":
+    parameterServer = Remote.ParameterServer(
+        App.ActiveDocument, port=int(os.environ.get("PARAMETER_SERVER_PORT", Remote.PORT))
+    ).start()
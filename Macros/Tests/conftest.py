@@ -0,0 +1,5 @@
+"""Make the macro libraries importable (`import Libraries001.X`) as FreeCAD does."""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
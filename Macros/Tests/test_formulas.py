@@ -0,0 +1,97 @@
+"""Formulas.evaluate against values the AutoGenerated sheet computes for the same inputs."""
+import numpy as np
+import pytest
+
+import Libraries001.Formulas as Formulas
+import Libraries001.Lattices as Lattices
+
+# (radius, separation, width, length) -> every computed cell, as FreeCAD shows them
+SHEET = [
+    (
+        (5, 1, 100, 120),
+        {
+            "xInterval": 16.732052474,
+            "yInterval": 9.660255,
+            "firstX": 0,
+            "firstY": 0,
+            "countX": 9,
+            "countY": 12,
+            "array2XPos": 8.366026237,
+            "array2YPos": 4.8301275,
+            "arrayCountX": 9,
+            "arrayCountY": 12,
+        },
+    ),
+    # B4 / E3 = 2.5 exactly: FreeCAD's round() goes away from zero, Python's to even
+    (
+        (1, 0.267949, 5, 0),
+        {
+            "xInterval": 3.464101615,
+            "yInterval": 2,
+            "firstX": 0,
+            "firstY": 0,
+            "countX": 2,
+            "countY": 5,
+            "array2XPos": 1.732050808,
+            "array2YPos": 1,
+            "arrayCountX": 1,
+            "arrayCountY": 4,
+        },
+    ),
+    # B5 / E2 just under 6.5
+    (
+        (2, 0.2, 37.5, 41.25),
+        {
+            "xInterval": 6.346410828,
+            "yInterval": 3.664102,
+            "firstX": 0,
+            "firstY": 0,
+            "countX": 8,
+            "countY": 12,
+            "array2XPos": 3.173205414,
+            "array2YPos": 1.832051,
+            "arrayCountX": 8,
+            "arrayCountY": 12,
+        },
+    ),
+]
+
+
+@pytest.mark.parametrize("inputs, expected", SHEET)
+def test_evaluate_matches_sheet(inputs, expected):
+    values = Formulas.evaluate(*inputs)
+    assert set(expected) == set(Formulas.FORMULAS)
+    for alias, value in expected.items():
+        assert values[alias] == pytest.approx(value, abs=1e-6), alias
+
+
+def test_evaluate_broadcasts():
+    radius = np.array([case[0][0] for case in SHEET])
+    separation = np.array([case[0][1] for case in SHEET])
+    width = np.array([case[0][2] for case in SHEET])
+    length = np.array([case[0][3] for case in SHEET])
+    values = Formulas.evaluate(radius, separation, width, length)
+    for alias in Formulas.FORMULAS:
+        assert values[alias] == pytest.approx([case[1][alias] for case in SHEET], abs=1e-6), alias
+
+
+def test_length_defaults_to_width():
+    assert Formulas.evaluate(5, 1, 100)["countX"] == Formulas.evaluate(5, 1, 100, 100)["countX"]
+
+
+@pytest.mark.parametrize("inputs, _", SHEET)
+def test_array_counts_match_lattices(inputs, _):
+    values = Formulas.evaluate(*inputs)
+    assert (values["arrayCountX"], values["arrayCountY"]) == Lattices.hexCounts(*inputs)
+
+
+def test_layout_uses_formulas():
+    pytest.importorskip("FreeCAD")
+    import Libraries001.Spreadsheets as Spreadsheets
+
+    layout = Spreadsheets.autoGeneratedLayout(100, 120)
+    for alias, (cell, formula) in Formulas.FORMULAS.items():
+        assert (cell, formula, alias) in layout
+    cells = {alias: cell for cell, _, alias in layout if alias}
+    for alias, cell in Formulas.INPUTS.items():
+        assert cells[alias] == cell
@@ -0,0 +1,123 @@
+"""ParameterServer and Client round trips, against a stand-in document and pipeline."""
+import queue
+import threading
+import types
+
+import pytest
+
+import Libraries001.Remote as Remote
+
+
+class StubPipeline:
+    """Records run() calls; parameters() stands in for the EditMe values."""
+
+    def __init__(self):
+        self.sheet = {"hexRadius": 5.0, "hexSeparation": 1.0, "hexExtrusion": -5.0, "planeOffset": -6.0}
+        self.runs = []
+        self.executed = []
+        self.recomputes = 0
+
+    def parameters(self):
+        return dict(self.sheet)
+
+    def run(self, source, subname, strategy="auto", **parameters):
+        self.runs.append((source, subname, strategy, parameters))
+        self.sheet.update(parameters)
+        self.executed = ["lattice", "cut"]
+        self.recomputes = 1
+        return types.SimpleNamespace(Shape=None)
+
+
+class StubDocument:
+    def getObject(self, name):
+        return name if name == "Pad" else None
+
+
+@pytest.fixture
+def served():
+    pipeline = StubPipeline()
+    gui = queue.Queue()
+    # One thread plays the GUI thread, running every dispatched drain
+    threading.Thread(target=lambda: [gui.get()() for _ in iter(int, 1)], daemon=True).start()
+    server = Remote.ParameterServer(StubDocument(), port=0, pipeline=pipeline, dispatch=gui.put).start()
+    client = Remote.Client(port=server.address[1])
+    yield client, pipeline
+    client.close()
+    server.stop()
+
+
+def test_get_params_reports_sheet_values(served):
+    client, _ = served
+    assert client.get_params() == {"radius": 5.0, "separation": 1.0, "height": -5.0, "planeOffset": -6.0}
+
+
+def test_set_params_stages_over_sheet_values(served):
+    client, pipeline = served
+    assert client.set_params(radius=3) == {"radius": 3.0, "separation": 1.0, "height": -5.0, "planeOffset": -6.0}
+    assert pipeline.runs == []
+
+
+def test_regenerate_passes_only_staged_values(served):
+    client, pipeline = served
+    client.set_params(radius=3)
+    result = client.regenerate(source="Pad", subname="Face6")
+    assert pipeline.runs == [("Pad", "Face6", "auto", {"hexRadius": 3.0})]
+    assert result["stages"] == ["lattice", "cut"]
+    assert result["recomputes"] == 1
+    assert client.get_params()["radius"] == 3.0
+
+
+def test_regenerate_reuses_previous_face(served):
+    client, pipeline = served
+    client.batch([("regenerate", {"source": "Pad", "subname": "Face6"}), ("regenerate", [])])
+    assert [run[:2] for run in pipeline.runs] == [("Pad", "Face6"), ("Pad", "Face6")]
+
+
+@pytest.mark.parametrize(
+    "method, params",
+    [
+        ("set_params", {"thickness": 1}),
+        ("regenerate", {"source": "Missing"}),
+        ("regenerate", [1, 2, 3, 4]),
+        ("export", {"path": "plate.obj"}),
+    ],
+)
+def test_invalid_params(served, method, params):
+    client, pipeline = served
+    with pytest.raises(Remote.RemoteError) as error:
+        client.batch([(method, params)])
+    assert error.value.code == Remote.INVALID_PARAMS
+    assert pipeline.runs == []
+
+
+def test_unknown_method(served):
+    client, _ = served
+    with pytest.raises(Remote.RemoteError) as error:
+        client.nothing()
+    assert error.value.code == Remote.METHOD_NOT_FOUND
+
+
+def test_inline_drains_do_not_overlap():
+    active, overlaps = [], []
+
+    class SlowPipeline(StubPipeline):
+        def run(self, *args, **kwargs):
+            active.append(1)
+            overlaps.append(len(active) > 1)
+            threading.Event().wait(0.05)
+            active.pop()
+            return super().run(*args, **kwargs)
+
+    server = Remote.ParameterServer(StubDocument(), port=0, pipeline=SlowPipeline(), dispatch=lambda fn: fn()).start()
+
+    def regenerate():
+        with Remote.Client(port=server.address[1]) as client:
+            client.regenerate(source="Pad")
+
+    threads = [threading.Thread(target=regenerate) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    server.stop()
+    assert len(overlaps) == 4 and not any(overlaps)
@@ -0,0 +1,43 @@
+"""Removed volume of a cut, as Sweeps.build reports it (needs FreeCAD)."""
+import numpy as np
+import pytest
+
+App = pytest.importorskip("FreeCAD")
+Part = pytest.importorskip("Part")
+
+import Libraries001.Clipping as Clipping  # noqa: E402
+import Libraries001.Patterns as Patterns  # noqa: E402
+
+HEIGHT = -2.0
+
+
+@pytest.fixture
+def doc():
+    doc = App.newDocument("TestSweeps")
+    yield doc
+    App.closeDocument(doc.Name)
+
+
+def test_removed_volume_counts_every_inside_cell(doc):
+    sheet = doc.addObject("Spreadsheet::Sheet", "EditMe")
+    for cell, alias, value in (("B2", "radius", "2"), ("B3", "separation", "0.5"), ("B6", "height", str(HEIGHT))):
+        sheet.set(cell, value)
+        sheet.setAlias(cell, alias)
+    face = doc.addObject("Part::Feature", "Face")
+    face.Shape = Part.makePlane(40, 30)
+    doc.recompute()
+
+    pattern = Patterns.LatticePattern(sheet, None, face, "hexagons")
+    pattern.classify()
+    # Only cells wholly inside: the plate gets holes and no boolean is needed
+    inside = pattern.labels == Clipping.INSIDE
+    pattern.centers, pattern.cells = pattern.centers[inside], pattern.cells[inside]
+    pattern.labels = pattern.labels[inside]
+    assert len(pattern.cells)
+
+    cut = pattern.cut()
+    x, y = pattern.cells[..., 0], pattern.cells[..., 1]
+    areas = 0.5 * np.abs((x * np.roll(y, -1, axis=1) - np.roll(x, -1, axis=1) * y).sum(axis=1))
+    removed = pattern.blankVolume(HEIGHT) - cut.Shape.Volume
+    assert removed == pytest.approx(areas.sum() * abs(HEIGHT), rel=1e-6)
+    assert removed == pytest.approx(len(areas) * areas[0] * abs(HEIGHT), rel=1e-6)
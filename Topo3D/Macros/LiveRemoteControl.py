@@ -1,19 +1,21 @@
-import time, os, traceback
+"""
+Run Topo3D/remote_script.py in FreeCAD whenever a tool drops it there.
 
-WATCHED_SCRIPT = "/home/leandropaolo1/Documents/VSCODE/Parametric-Modeling/FreecadSeries/Topo3D/remote_script.py"
+Uses the shared watcher in Macros/LiveRemoteControl.py (non-blocking,
+runs on the GUI thread) and deletes the script after each run.
+"""
+import importlib.util
+import os
 
-def watch_and_run():
-    print("🔁 Watching for:", WATCHED_SCRIPT)
-    while True:
-        if os.path.exists(WATCHED_SCRIPT):
-            try:
-                with open(WATCHED_SCRIPT, 'r') as f:
-                    code = f.read()
-                print("🚀 Executing remote_script.py...")
-                exec(code, globals())
-                os.remove(WATCHED_SCRIPT)
-            except Exception as e:
-                print("❌ Error running script:\n", traceback.format_exc())
-        time.sleep(1)
+HERE = os.path.dirname(os.path.abspath(__file__))
+WATCHED_SCRIPT = os.environ.get(
+    "LIVE_REMOTE_SCRIPT", os.path.join(os.path.dirname(HERE), "remote_script.py")
+)
 
-watch_and_run()
+_spec = importlib.util.spec_from_file_location(
+    "LiveRemoteControl", os.path.join(HERE, "..", "..", "Macros", "LiveRemoteControl.py")
+)
+LiveRemoteControl = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(LiveRemoteControl)
+
+liveRemoteControl = LiveRemoteControl.start(WATCHED_SCRIPT, consume=True)